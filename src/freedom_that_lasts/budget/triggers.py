@@ -6,6 +6,9 @@ They evaluate budget state and emit reflex events (warnings).
 
 This is the budget "immune system" - it detects violations
 and overspending automatically.
+
+Reflex payloads are built from projection state, which was validated when
+its events were emitted, so they use model_construct rather than re-validating.
 """
 
 from datetime import datetime
@@ -44,8 +47,8 @@ def evaluate_budget_balance_trigger(
     for budget in active_budgets:
         # Calculate total allocated
         total_allocated = sum(
-            Decimal(str(item["allocated_amount"]))
-            for item in budget["items"].values()
+            (Decimal(str(item["allocated_amount"])) for item in budget["items"].values()),
+            Decimal("0"),
         )
         budget_total = Decimal(str(budget["budget_total"]))
 
@@ -62,7 +65,7 @@ def evaluate_budget_balance_trigger(
                 event_type="BudgetBalanceViolationDetected",
                 occurred_at=now,
                 actor_id="system",
-                payload=BudgetBalanceViolationDetected(
+                payload=BudgetBalanceViolationDetected.model_construct(
                     budget_id=budget["budget_id"],
                     detected_at=now,
                     budget_total=budget_total,
@@ -118,7 +121,7 @@ def evaluate_expenditure_overspend_trigger(
                     event_type="BudgetOverspendDetected",
                     occurred_at=now,
                     actor_id="system",
-                    payload=BudgetOverspendDetected(
+                    payload=BudgetOverspendDetected.model_construct(
                         budget_id=budget["budget_id"],
                         item_id=item["item_id"],
                         detected_at=now,
@@ -10,6 +10,7 @@ from typing import Any
 
 from freedom_that_lasts.feedback.models import FreedomHealthScore, RiskLevel
 from freedom_that_lasts.kernel.events import Event
+from freedom_that_lasts.kernel.time import to_datetime
 
 
 class FreedomHealthProjection:
@@ -95,11 +96,7 @@ class SafetyEventLog:
         """Get most recent safety events"""
         return sorted(
             self.events,
-            key=lambda e: (
-                e["occurred_at"]
-                if isinstance(e["occurred_at"], datetime)
-                else datetime.fromisoformat(e["occurred_at"])
-            ),
+            key=lambda e: to_datetime(e["occurred_at"]),
             reverse=True,
         )[:limit]
 
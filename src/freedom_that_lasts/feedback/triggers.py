@@ -186,7 +186,8 @@ def evaluate_law_review_trigger(
                 event_type="LawReviewTriggered",
                 occurred_at=now,
                 actor_id="system",
-                payload=LawReviewTriggered(
+                # law is a registry projection entry: already validated
+                payload=LawReviewTriggered.model_construct(
                     law_id=law["law_id"],
                     triggered_at=now,
                     triggered_by=None,  # System trigger
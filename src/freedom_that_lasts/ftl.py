@@ -60,7 +60,6 @@ from freedom_that_lasts.law.commands import (
     TriggerLawReview,
 )
 from freedom_that_lasts.law.handlers import LawCommandHandlers
-from freedom_that_lasts.law.invariants import compute_in_degrees
 from freedom_that_lasts.law.models import ReversibilityClass
 from freedom_that_lasts.law.projections import DelegationGraph, LawRegistry, WorkspaceRegistry
 from freedom_that_lasts.resource.commands import (
@@ -211,16 +210,11 @@ class FTL:
 
         for event in all_events:
             # Apply to appropriate projections
-            if event.event_type in ["WorkspaceCreated", "WorkspaceArchived"]:
+            if event.event_type in WorkspaceRegistry.HANDLED_EVENT_TYPES:
                 self.workspace_registry.apply_event(event)
-            elif event.event_type in [
-                "DecisionRightDelegated",
-                "DelegationRevoked",
-                "DelegationExpired",
-                "DelegationRenewed",
-            ]:
+            elif event.event_type in DelegationGraph.HANDLED_EVENT_TYPES:
                 self.delegation_graph.apply_event(event)
-            elif event.event_type.startswith("Law"):
+            elif event.event_type in LawRegistry.HANDLED_EVENT_TYPES:
                 self.law_registry.apply_event(event)
             elif event.event_type.startswith("Budget") or event.event_type.startswith(
                 "Expenditure"
@@ -565,27 +559,13 @@ class FTL:
         with LogOperation(logger, "compute_health"):
             # Compute fresh health assessment
             now = self.time_provider.now()
-            active_edges = self.delegation_graph.get_active_edges(now)
-            in_degree_map = compute_in_degrees(active_edges, now)
+            in_degree_map = self.delegation_graph.active_in_degrees(now)
             overdue_laws = self.law_registry.list_overdue_reviews(now)
             active_laws = self.law_registry.list_active()
 
             # Count upcoming reviews
-            from datetime import timedelta
-
-            upcoming_7d = 0
-            upcoming_30d = 0
-            for law in active_laws:
-                if law.get("next_checkpoint_at"):
-                    checkpoint_dt = (
-                        datetime.fromisoformat(law["next_checkpoint_at"])
-                        if isinstance(law["next_checkpoint_at"], str)
-                        else law["next_checkpoint_at"]
-                    )
-                    if now < checkpoint_dt <= now + timedelta(days=7):
-                        upcoming_7d += 1
-                    if now < checkpoint_dt <= now + timedelta(days=30):
-                        upcoming_30d += 1
+            upcoming_7d = len(self.law_registry.list_upcoming_reviews(now, 7))
+            upcoming_30d = len(self.law_registry.list_upcoming_reviews(now, 30))
 
             health_score = compute_freedom_health(
                 in_degree_map=in_degree_map,
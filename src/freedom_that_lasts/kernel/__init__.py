@@ -17,17 +17,26 @@ from freedom_that_lasts.kernel.errors import (
     StreamVersionConflict,
 )
 from freedom_that_lasts.kernel.events import Event
-from freedom_that_lasts.kernel.ids import IdFactory, generate_id
-from freedom_that_lasts.kernel.time import RealTimeProvider, TestTimeProvider, TimeProvider
+from freedom_that_lasts.kernel.ids import IdFactory, generate_id, generate_ids
+from freedom_that_lasts.kernel.time import (
+    RealTimeProvider,
+    TestTimeProvider,
+    TimeProvider,
+    to_datetime,
+    to_epoch_ns,
+)
 
 __all__ = [
     # IDs
     "IdFactory",
     "generate_id",
+    "generate_ids",
     # Time
     "TimeProvider",
     "RealTimeProvider",
     "TestTimeProvider",
+    "to_datetime",
+    "to_epoch_ns",
     # Events & Commands
     "Event",
     "Command",
@@ -9,9 +9,10 @@ you can replay history to any point and see exactly what the system
 state was at that moment!
 """
 
+import sys
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class Event(BaseModel):
@@ -75,6 +76,18 @@ class Event(BaseModel):
         ge=1,
     )
 
+    @field_validator("event_type", "stream_type")
+    @classmethod
+    def intern_type_name(cls, v: str) -> str:
+        """
+        Intern type names so all events share one string object per type
+
+        Events loaded from the store get freshly decoded strings; interning
+        makes dispatch-table lookups and equality checks against the
+        (interned) literals short-circuit on identity during replay.
+        """
+        return sys.intern(v)
+
     model_config = {
         "frozen": True,  # Events are immutable
         "json_schema_extra": {
@@ -22,27 +22,19 @@ class IdFactory(Protocol):
         ...
 
 
-def generate_id() -> str:
+def _format_id(timestamp_48: int, rand_74: int) -> str:
     """
-    Generate a UUIDv7-like identifier (time-ordered UUID)
+    Format a 48-bit timestamp and 74 random bits as a UUIDv7-like string
 
-    Format: 8-4-4-4-12 hex characters (36 chars with hyphens)
-    First 48 bits: Unix timestamp in milliseconds
-    Next 12 bits: Random
-    Remaining 62 bits: Random
+    Args:
+        timestamp_48: Unix timestamp in milliseconds (48 bits)
+        rand_74: Random bits (split into the 12 + 62 bit fields)
 
     Returns:
-        Sortable UUID string (e.g., "01908e9a-3b87-7000-8000-123456789abc")
+        Sortable UUID string
     """
-    # Get current timestamp in milliseconds
-    timestamp_ms = int(time.time() * 1000)
-
-    # Extract 48 bits of timestamp
-    timestamp_48 = timestamp_ms & 0xFFFFFFFFFFFF
-
-    # Generate random bits
-    rand_12 = secrets.randbits(12)
-    rand_62 = secrets.randbits(62)
+    rand_12 = rand_74 >> 62
+    rand_62 = rand_74 & 0x3FFFFFFFFFFFFFFF
 
     # Construct UUIDv7-like format
     # Version 7 (0111) in bits 48-51
@@ -54,7 +46,7 @@ def generate_id() -> str:
     node = rand_62 & 0xFFFFFFFFFFFF
 
     # Format as UUID string
-    uuid_str = (
+    return (
         f"{time_high:04x}{time_mid:04x}-"
         f"{(time_low_and_version >> 16) & 0xFFFF:04x}-"
         f"{time_low_and_version & 0xFFFF:04x}-"
@@ -62,7 +54,46 @@ def generate_id() -> str:
         f"{node:012x}"
     )
 
-    return uuid_str
+
+def generate_id() -> str:
+    """
+    Generate a UUIDv7-like identifier (time-ordered UUID)
+
+    Format: 8-4-4-4-12 hex characters (36 chars with hyphens)
+    First 48 bits: Unix timestamp in milliseconds
+    Next 12 bits: Random
+    Remaining 62 bits: Random
+
+    Returns:
+        Sortable UUID string (e.g., "01908e9a-3b87-7000-8000-123456789abc")
+    """
+    # Get current timestamp in milliseconds (48 bits)
+    timestamp_48 = int(time.time() * 1000) & 0xFFFFFFFFFFFF
+
+    # Generate random bits (one 74-bit draw split into the 12 + 62 bit fields)
+    return _format_id(timestamp_48, secrets.randbits(74))
+
+
+def generate_ids(n: int) -> list[str]:
+    """
+    Generate n UUIDv7-like identifiers from a single entropy draw
+
+    All IDs share the current millisecond timestamp; their random bits are
+    sliced from one secrets.randbits(74 * n) call instead of n separate draws.
+
+    Args:
+        n: Number of IDs to generate
+
+    Returns:
+        List of n sortable UUID strings
+    """
+    if n <= 0:
+        return []
+
+    timestamp_48 = int(time.time() * 1000) & 0xFFFFFFFFFFFF
+    rand_bits = secrets.randbits(74 * n)
+    mask_74 = (1 << 74) - 1
+    return [_format_id(timestamp_48, (rand_bits >> (74 * i)) & mask_74) for i in range(n)]
 
 
 class DefaultIdFactory:
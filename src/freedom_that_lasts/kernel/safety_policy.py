@@ -8,6 +8,7 @@ Fun fact: These parameters are like the "physical constants" of the governance
 universe - they define the boundaries within which freedom remains stable!
 """
 
+from functools import lru_cache
 from typing import Literal
 
 from pydantic import BaseModel, Field
@@ -176,21 +177,36 @@ class SafetyPolicy(BaseModel):
         Returns:
             True if schedule meets minimum requirements
         """
-        if not checkpoints:
+        # Keyed on the schedules themselves (not policy_version), so mutating
+        # law_min_checkpoint_schedule can never serve a stale answer
+        return _schedule_covers_minimum(
+            tuple(checkpoints), tuple(self.law_min_checkpoint_schedule)
+        )
+
+
+@lru_cache(maxsize=1024)
+def _schedule_covers_minimum(
+    checkpoints: tuple[int, ...], minimum_schedule: tuple[int, ...]
+) -> bool:
+    """
+    Check that every minimum checkpoint has a proposed checkpoint nearby
+
+    Memoized: canonical schedules like (30, 90, 180, 365) recur on
+    almost every law activation.
+    """
+    if not checkpoints:
+        return False
+
+    # Check that all minimum checkpoints are covered
+    tolerance_days = 5
+    for min_checkpoint in minimum_schedule:
+        # Find any checkpoint within tolerance of min_checkpoint
+        # (can be before or after)
+        found = any(abs(cp - min_checkpoint) <= tolerance_days for cp in checkpoints)
+        if not found:
             return False
 
-        # Check that all minimum checkpoints are covered
-        tolerance_days = 5
-        for min_checkpoint in self.law_min_checkpoint_schedule:
-            # Find any checkpoint within tolerance of min_checkpoint
-            # (can be before or after)
-            found = any(
-                abs(cp - min_checkpoint) <= tolerance_days for cp in checkpoints
-            )
-            if not found:
-                return False
-
-        return True
+    return True
 
 
 # Default global policy instance
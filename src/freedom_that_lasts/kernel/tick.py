@@ -25,7 +25,6 @@ from freedom_that_lasts.kernel.logging import LogOperation, get_logger
 from freedom_that_lasts.kernel.safety_policy import SafetyPolicy
 from freedom_that_lasts.kernel.time import TimeProvider
 from freedom_that_lasts.law.events import SystemTick
-from freedom_that_lasts.law.invariants import compute_in_degrees
 from freedom_that_lasts.law.projections import DelegationGraph, LawRegistry
 from freedom_that_lasts.resource.triggers import evaluate_all_procurement_triggers
 
@@ -156,14 +155,13 @@ class TickEngine:
             )
 
             # Compute current state for triggers
-            active_edges = delegation_graph.get_active_edges(now)
-            in_degree_map = compute_in_degrees(active_edges, now)
+            in_degree_map = delegation_graph.active_in_degrees(now)
             overdue_laws = law_registry.list_overdue_reviews(now)
 
             logger.debug(
                 "Computed governance state",
                 tick_id=tick_id,
-                active_edges_count=len(active_edges),
+                active_edges_count=sum(in_degree_map.values()),
                 unique_actors=len(in_degree_map),
                 overdue_laws_count=len(overdue_laws),
             )
@@ -320,20 +318,7 @@ class TickEngine:
         self, law_registry: LawRegistry, now: datetime, days: int
     ) -> int:
         """Count laws with reviews due in next N days"""
-        from datetime import timedelta
-
-        future = now + timedelta(days=days)
-        count = 0
-
-        for law in law_registry.list_active():
-            if law.get("next_checkpoint_at"):
-                checkpoint_dt = (
-                    datetime.fromisoformat(law["next_checkpoint_at"])
-                    if isinstance(law["next_checkpoint_at"], str)
-                    else law["next_checkpoint_at"]
-                )
-                if now < checkpoint_dt <= future:
-                    count += 1
+        count = len(law_registry.list_upcoming_reviews(now, days))
 
         logger.debug(
             "Counted upcoming reviews",
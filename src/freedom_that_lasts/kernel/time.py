@@ -9,6 +9,7 @@ This abstraction sidesteps relativity theory by making time injectable!
 """
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Protocol
 
 
@@ -66,5 +67,53 @@ class TestTimeProvider:
         self._current_time += timedelta(days=days)
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+NS_PER_DAY = 86_400 * 1_000_000_000
+
+
+def to_epoch_ns(dt: datetime) -> int:
+    """
+    Convert a datetime to integer nanoseconds since the Unix epoch
+
+    Exact integer arithmetic (no float rounding), so ordering of the
+    results matches ordering of the datetimes. Naive datetimes are
+    treated as UTC.
+
+    Args:
+        dt: Datetime to convert
+
+    Returns:
+        Nanoseconds since 1970-01-01T00:00:00Z
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    delta = dt - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
+@lru_cache(maxsize=65536)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 string (cached: datetimes are immutable, so sharing is safe)"""
+    return datetime.fromisoformat(value)
+
+
+def to_datetime(value: datetime | str) -> datetime:
+    """
+    Coerce an ISO 8601 string or datetime to a datetime
+
+    Projections and payloads hold timestamps as ISO strings; the same
+    strings (shared expiry dates, checkpoints, claim validity windows)
+    recur across rows and replays, so parsed results are cached.
+
+    Args:
+        value: ISO 8601 string or datetime (returned unchanged)
+
+    Returns:
+        Parsed datetime
+    """
+    return _parse_iso(value) if isinstance(value, str) else value
+
+
 # Global default time provider
 default_time_provider: TimeProvider = RealTimeProvider()
@@ -145,6 +145,7 @@ class LawReviewCompleted(BaseModel):
     outcome: str  # "continue" | "adjust" | "sunset"
     notes: str | None
     next_checkpoint_at: datetime | None
+    next_checkpoint_index: int | None = None  # Index of next_checkpoint_at in checkpoints
 
 
 class LawAdjusted(BaseModel):
@@ -543,6 +543,7 @@ class LawCommandHandlers:
 
             # Compute next checkpoint if outcome is "continue"
             next_checkpoint_at = None
+            next_checkpoint_index = None
             if command.outcome == "continue":
                 logger.debug("Computing next checkpoint for law continuation", law_id=command.law_id)
                 checkpoints = law["checkpoints"]
@@ -559,7 +560,7 @@ class LawCommandHandlers:
                     next_index = current_index + 1
 
                     if next_index < len(checkpoints):
-                        next_checkpoint_at, _ = compute_next_checkpoint(
+                        next_checkpoint_at, next_checkpoint_index = compute_next_checkpoint(
                             activated_at, checkpoints, next_index
                         )
 
@@ -573,6 +574,7 @@ class LawCommandHandlers:
                 outcome=command.outcome,
                 notes=command.notes,
                 next_checkpoint_at=next_checkpoint_at,
+                next_checkpoint_index=next_checkpoint_index,
             ).model_dump(mode="json")
 
             event = create_event(
@@ -9,13 +9,16 @@ certain decisions apply. Think of it as a "governance boundary" rather than
 a traditional organizational unit!
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from sqlmodel import SQLModel
 
+from freedom_that_lasts.kernel.time import NS_PER_DAY, to_epoch_ns
+
 
 class ReversibilityClass(str, Enum):
     """
@@ -206,12 +209,34 @@ class Law(BaseModel):
         """Check if law is currently active (in effect)"""
         return self.status == LawStatus.ACTIVE
 
+    # (next_checkpoint_at, nanoseconds) memo; re-derived if the field is reassigned
+    _checkpoint_ns_cache: tuple[datetime, int] | None = PrivateAttr(default=None)
+
+    @property
+    def next_checkpoint_ns(self) -> int | None:
+        """Next checkpoint as nanoseconds since the Unix epoch (None if unscheduled)"""
+        checkpoint_at = self.next_checkpoint_at
+        if checkpoint_at is None:
+            return None
+        cache = self._checkpoint_ns_cache
+        if cache is None or cache[0] is not checkpoint_at:
+            cache = (checkpoint_at, to_epoch_ns(checkpoint_at))
+            self._checkpoint_ns_cache = cache
+        return cache[1]
+
     def is_review_overdue(self, now: datetime) -> bool:
         """Check if review checkpoint is overdue"""
         if self.next_checkpoint_at is None:
             return False
         return now > self.next_checkpoint_at
 
+    def is_review_overdue_ns(self, now_ns: int) -> bool:
+        """Integer-time variant of is_review_overdue() for bulk scans"""
+        checkpoint_ns = self.next_checkpoint_ns
+        if checkpoint_ns is None:
+            return False
+        return now_ns > checkpoint_ns
+
     def days_until_checkpoint(self, now: datetime) -> int | None:
         """Get days until next checkpoint (None if no checkpoint scheduled)"""
         if self.next_checkpoint_at is None:
@@ -219,6 +244,13 @@ class Law(BaseModel):
         delta = self.next_checkpoint_at - now
         return delta.days
 
+    def days_until_checkpoint_ns(self, now_ns: int) -> int | None:
+        """Integer-time variant of days_until_checkpoint() (floors like timedelta.days)"""
+        checkpoint_ns = self.next_checkpoint_ns
+        if checkpoint_ns is None:
+            return None
+        return (checkpoint_ns - now_ns) // NS_PER_DAY
+
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -260,11 +292,19 @@ class WorkspaceProjection(SQLModel):
     created_at: datetime
 
 
-class DelegationEdge(BaseModel):
+@dataclass(slots=True, frozen=True)
+class DelegationEdge:
     """
     Single edge in delegation graph
 
     Used for building and analyzing the delegation DAG.
+    Graph scans compare expires_ns (integer nanoseconds) rather than
+    expires_at, avoiding datetime comparison on every edge.
+
+    A slotted frozen dataclass rather than a Pydantic model: edges are
+    internal graph views (never API payloads), so validation buys nothing
+    while attribute access and per-instance memory are on the hot path.
+    State changes produce a new edge via dataclasses.replace().
     """
 
     delegation_id: str
@@ -273,6 +313,11 @@ class DelegationEdge(BaseModel):
     workspace_id: str
     expires_at: datetime
     is_active: bool
+    expires_ns: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Expiry as nanoseconds since the Unix epoch, computed once
+        object.__setattr__(self, "expires_ns", to_epoch_ns(self.expires_at))
 
 
 class LawSummary(BaseModel):
@@ -290,3 +335,25 @@ class LawSummary(BaseModel):
     reversibility_class: ReversibilityClass
     next_checkpoint_at: datetime | None
     is_review_overdue: bool
+
+    @classmethod
+    def build_many(cls, laws: list[Law], now: datetime) -> list["LawSummary"]:
+        """
+        Summarize many laws for a dashboard in one pass
+
+        Converts 'now' to nanoseconds once and compares integers per law,
+        instead of datetime arithmetic on every row.
+        """
+        now_ns = to_epoch_ns(now)
+        return [
+            cls(
+                law_id=law.law_id,
+                workspace_id=law.workspace_id,
+                title=law.title,
+                status=law.status,
+                reversibility_class=law.reversibility_class,
+                next_checkpoint_at=law.next_checkpoint_at,
+                is_review_overdue=law.is_review_overdue_ns(now_ns),
+            )
+            for law in laws
+        ]
@@ -8,14 +8,207 @@ Fun fact: Projections are like "materialized views" in traditional databases,
 but better - they're versioned, rebuildable, and can be customized per use case!
 """
 
+import json
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import replace
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar, Self
 
 from freedom_that_lasts.kernel.events import Event
+from freedom_that_lasts.kernel.time import NS_PER_DAY, to_datetime, to_epoch_ns
 from freedom_that_lasts.law.models import Delegation, DelegationEdge, Law, LawStatus, Workspace
 
+# Compact snapshot encoder: no whitespace, raw UTF-8 instead of \uXXXX escapes,
+# and no circular-reference bookkeeping (to_dict() output is a plain tree)
+_SNAPSHOT_ENCODER = json.JSONEncoder(
+    separators=(",", ":"),
+    ensure_ascii=False,
+    check_circular=False,
+)
 
-class WorkspaceRegistry:
+
+class _VersionedProjection(ABC):
+    """
+    Shared event-application machinery for the law projections
+
+    Dispatches each event through the subclass's _HANDLERS table and
+    keeps a per-stream version watermark. Event versions are per stream
+    (every stream starts at 1), so the watermark is a stream_id -> version
+    map rather than a single integer. An event at or below its stream's
+    watermark was already applied and is skipped, which makes replaying an
+    overlapping tail of the log (warm restart, catch-up) idempotent.
+
+    position_event_id records the last applied event, matching the
+    position tracking of the projection store, so catch-up can load only
+    the events after it.
+
+    Projections are shared between the command path and concurrent
+    readers (e.g. health server threads). Writes hold _lock and bump
+    generation; list queries are served from immutable tuple snapshots
+    that are built once under the same lock and tagged with the generation
+    they were built at. A snapshot from an older generation is simply
+    rebuilt on its next read, so writes never touch the cache and repeated
+    reads do not rescan. Queries that cannot be snapshotted (they depend on
+    a "now" or an actor) copy what they need under _lock instead, so no
+    reader iterates a container while a writer is changing it.
+    Callers can use generation the same way to cache derived results.
+    """
+
+    _HANDLERS: ClassVar[dict[str, Callable[[Any, Event], None]]] = {}
+    # Event types this projection reacts to, derived from _HANDLERS
+    HANDLED_EVENT_TYPES: ClassVar[frozenset[str]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.HANDLED_EVENT_TYPES = frozenset(cls._HANDLERS)
+
+    def __init__(self) -> None:
+        self.stream_versions: dict[str, int] = {}
+        self.position_event_id: str | None = None
+        # Number of events applied; changes whenever projection state changes
+        self.generation = 0
+        # Query key -> (generation built at, cached result)
+        self._snapshots: dict[Hashable, tuple[int, tuple[Any, ...]]] = {}
+        self._lock = threading.Lock()
+
+    def apply_event(self, event: Event) -> None:
+        """Apply an event to update projection state"""
+        handler = self._HANDLERS.get(event.event_type)
+        if handler is None:
+            return
+        with self._lock:
+            if event.version <= self.stream_versions.get(event.stream_id, 0):
+                return  # Already applied
+
+            handler(self, event)
+            self.stream_versions[event.stream_id] = event.version
+            self.position_event_id = event.event_id
+            self.generation += 1
+
+    def apply_events(self, events: Iterable[Event]) -> None:
+        """
+        Apply a run of events in log order
+
+        Same result as calling apply_event() for each event, with the
+        handler table and watermark hoisted out of the loop. Events are
+        not regrouped by type: a law's transitions (e.g. review triggered,
+        completed, triggered again) depend on their relative order.
+
+        Args:
+            events: Events to apply, in log order
+        """
+        handlers = self._HANDLERS
+        stream_versions = self.stream_versions
+        with self._lock:
+            last_event_id = self.position_event_id
+            applied = 0
+            try:
+                for event in events:
+                    handler = handlers.get(event.event_type)
+                    if handler is None:
+                        continue
+                    stream_id = event.stream_id
+                    if event.version <= stream_versions.get(stream_id, 0):
+                        continue  # Already applied
+                    handler(self, event)
+                    stream_versions[stream_id] = event.version
+                    last_event_id = event.event_id
+                    applied += 1
+            finally:
+                # Keep the position consistent with the watermark if a handler raises
+                self.position_event_id = last_event_id
+                self.generation += applied
+
+    def _snapshot(self, key: Hashable, build: Callable[[], Iterable[Any]]) -> tuple[Any, ...]:
+        """
+        Return the cached result for key, rebuilding it under the write lock if stale
+
+        Args:
+            key: Query identity (e.g. ("status", "ACTIVE"))
+            build: Produces the result from current state
+
+        Returns:
+            Immutable result, valid until the next write
+        """
+        cached = self._snapshots.get(key)
+        if cached is not None and cached[0] == self.generation:
+            return cached[1]
+        with self._lock:
+            cached = self._snapshots.get(key)
+            if cached is None or cached[0] != self.generation:
+                cached = (self.generation, tuple(build()))
+                self._snapshots[key] = cached
+            return cached[1]
+
+    @classmethod
+    def rebuild_from(cls, snapshot: dict[str, Any] | None, events: Iterable[Event]) -> Self:
+        """
+        Restore from a snapshot, then apply only the events after it
+
+        The snapshot is a to_dict() result, e.g. the state saved in
+        SQLiteProjectionStore together with position_event_id. Events the
+        snapshot already covers are skipped by the watermark, so passing an
+        overlapping tail (or even the full log) is safe.
+
+        Args:
+            snapshot: Previously saved to_dict() state, or None for a cold rebuild
+            events: Events to replay on top of the snapshot, in log order
+
+        Returns:
+            Rebuilt projection
+        """
+        projection = cls.from_dict(snapshot) if snapshot is not None else cls()
+        projection.apply_events(events)
+        return projection
+
+    @classmethod
+    @abstractmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Deserialize from dict"""
+
+    @abstractmethod
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to dict for storage"""
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize to compact UTF-8 JSON for snapshot storage
+
+        Returns:
+            Encoded to_dict() state, readable by from_bytes()
+        """
+        return _SNAPSHOT_ENCODER.encode(self.to_dict()).encode("utf-8")
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """
+        Deserialize a snapshot written by to_bytes()
+
+        Args:
+            data: UTF-8 JSON bytes
+
+        Returns:
+            Restored projection
+        """
+        return cls.from_dict(json.loads(data))
+
+    def _watermark_to_dict(self) -> dict[str, Any]:
+        """Serialize the watermark alongside projection state"""
+        return {
+            "stream_versions": self.stream_versions,
+            "position_event_id": self.position_event_id,
+        }
+
+    def _restore_watermark(self, data: dict[str, Any]) -> None:
+        """Restore the watermark written by _watermark_to_dict()"""
+        self.stream_versions = dict(data.get("stream_versions", {}))
+        self.position_event_id = data.get("position_event_id")
+
+
+class WorkspaceRegistry(_VersionedProjection):
     """
     Projection: Registry of all workspaces
 
@@ -23,26 +216,33 @@ class WorkspaceRegistry:
     """
 
     def __init__(self) -> None:
+        super().__init__()
         self.workspaces: dict[str, dict[str, Any]] = {}
 
-    def apply_event(self, event: Event) -> None:
-        """Apply an event to update projection state"""
-        if event.event_type == "WorkspaceCreated":
-            self.workspaces[event.payload["workspace_id"]] = {
-                "workspace_id": event.payload["workspace_id"],
-                "name": event.payload["name"],
-                "parent_workspace_id": event.payload.get("parent_workspace_id"),
-                "scope": event.payload.get("scope", {}),
-                "created_at": event.payload["created_at"],
-                "is_active": True,
-                "version": event.version,
-            }
-
-        elif event.event_type == "WorkspaceArchived":
-            workspace_id = event.payload["workspace_id"]
-            if workspace_id in self.workspaces:
-                self.workspaces[workspace_id]["is_active"] = False
-                self.workspaces[workspace_id]["archived_at"] = event.payload["archived_at"]
+    def _apply_workspace_created(self, event: Event) -> None:
+        """Apply WorkspaceCreated event"""
+        self.workspaces[event.payload["workspace_id"]] = {
+            "workspace_id": event.payload["workspace_id"],
+            "name": event.payload["name"],
+            "parent_workspace_id": event.payload.get("parent_workspace_id"),
+            "scope": event.payload.get("scope", {}),
+            "created_at": event.payload["created_at"],
+            "is_active": True,
+            "version": event.version,
+        }
+
+    def _apply_workspace_archived(self, event: Event) -> None:
+        """Apply WorkspaceArchived event"""
+        workspace_id = event.payload["workspace_id"]
+        if workspace_id in self.workspaces:
+            self.workspaces[workspace_id]["is_active"] = False
+            self.workspaces[workspace_id]["archived_at"] = event.payload["archived_at"]
+
+    # Event type -> handler, resolved with one dict lookup per event
+    _HANDLERS: ClassVar[dict[str, Callable[["WorkspaceRegistry", Event], None]]] = {
+        "WorkspaceCreated": _apply_workspace_created,
+        "WorkspaceArchived": _apply_workspace_archived,
+    }
 
     def get(self, workspace_id: str) -> dict[str, Any] | None:
         """Get workspace by ID"""
@@ -50,110 +250,285 @@ class WorkspaceRegistry:
 
     def list_active(self) -> list[dict[str, Any]]:
         """List all active workspaces"""
-        return [ws for ws in self.workspaces.values() if ws["is_active"]]
+        return list(
+            self._snapshot(
+                "active", lambda: [ws for ws in self.workspaces.values() if ws["is_active"]]
+            )
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dict for storage"""
-        return {"workspaces": self.workspaces}
+        return {"workspaces": self.workspaces, **self._watermark_to_dict()}
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "WorkspaceRegistry":
+    def from_dict(cls, data: dict[str, Any]) -> Self:
         """Deserialize from dict"""
         registry = cls()
         registry.workspaces = data.get("workspaces", {})
+        registry._restore_watermark(data)
         return registry
 
 
-class DelegationGraph:
+class DelegationGraph(_VersionedProjection):
     """
     Projection: Delegation graph for cycle detection and analysis
 
     Maintains both individual delegations and the graph structure
     for efficient invariant checking and concentration analysis.
+
+    Besides the full edge history (edges, keyed by delegation id so
+    revoke/expire is a single lookup), the graph keeps incrementally
+    maintained indexes over active (not revoked / not expired-by-event)
+    edges: _active_edges (by delegation id), out_edges (adjacency) and
+    in_degrees. They are updated on every
+    add/remove so queries never rebuild the graph from scratch.
+    Active edges are also kept as two parallel columns sorted by expiry
+    (_expiry_ns / _expiry_ids), so the edges that have passed their
+    expiry at a given time are a prefix found by binary search.
+    _by_from / _by_to map each actor to the ids of its active
+    delegations, so per-actor lookups touch only the matching rows.
     """
 
     def __init__(self) -> None:
+        super().__init__()
         self.delegations: dict[str, dict[str, Any]] = {}
-        self.edges: list[DelegationEdge] = []
-
-    def apply_event(self, event: Event) -> None:
-        """Apply an event to update projection state"""
-        if event.event_type == "DecisionRightDelegated":
-            delegation_id = event.payload["delegation_id"]
-            self.delegations[delegation_id] = {
-                "delegation_id": delegation_id,
-                "workspace_id": event.payload["workspace_id"],
-                "from_actor": event.payload["from_actor"],
-                "to_actor": event.payload["to_actor"],
-                "delegated_at": event.payload["delegated_at"],
-                "ttl_days": event.payload["ttl_days"],
-                "expires_at": event.payload["expires_at"],
-                "renewable": event.payload.get("renewable", True),
-                "visibility": event.payload.get("visibility", "private"),
-                "purpose_tag": event.payload.get("purpose_tag"),
-                "is_active": True,
-                "revoked_at": None,
-                "version": event.version,
-            }
-
-            # Add edge for graph analysis
-            self.edges.append(
-                DelegationEdge(
-                    delegation_id=delegation_id,
-                    from_actor=event.payload["from_actor"],
-                    to_actor=event.payload["to_actor"],
-                    workspace_id=event.payload["workspace_id"],
-                    expires_at=datetime.fromisoformat(event.payload["expires_at"])
-                    if isinstance(event.payload["expires_at"], str)
-                    else event.payload["expires_at"],
-                    is_active=True,
-                )
-            )
-
-        elif event.event_type == "DelegationRevoked":
-            delegation_id = event.payload["delegation_id"]
-            if delegation_id in self.delegations:
-                self.delegations[delegation_id]["is_active"] = False
-                self.delegations[delegation_id]["revoked_at"] = event.payload["revoked_at"]
-
-                # Update edge
-                for edge in self.edges:
-                    if edge.delegation_id == delegation_id:
-                        edge.is_active = False
-
-        elif event.event_type == "DelegationExpired":
-            delegation_id = event.payload["delegation_id"]
-            if delegation_id in self.delegations:
-                self.delegations[delegation_id]["is_active"] = False
-
-                # Update edge
-                for edge in self.edges:
-                    if edge.delegation_id == delegation_id:
-                        edge.is_active = False
+        # delegation_id -> edge, for every delegation ever recorded
+        self.edges: dict[str, DelegationEdge] = {}
+        # delegation_id -> active edge, in delegation order
+        self._active_edges: dict[str, DelegationEdge] = {}
+        # from_actor -> delegation_id -> active edge
+        self.out_edges: dict[str, dict[str, DelegationEdge]] = {}
+        # to_actor -> number of active incoming edges
+        self.in_degrees: dict[str, int] = {}
+        # Active edges sorted by expiry: parallel expires_ns / delegation_id columns
+        self._expiry_ns: list[int] = []
+        self._expiry_ids: list[str] = []
+        # actor -> ids of active delegations from / to that actor (dicts
+        # used as insertion-ordered sets so results stay deterministic)
+        self._by_from: dict[str, dict[str, None]] = {}
+        self._by_to: dict[str, dict[str, None]] = {}
+
+    def _index_delegation(self, delegation: dict[str, Any]) -> None:
+        """Add an active delegation to the per-actor indexes"""
+        delegation_id = delegation["delegation_id"]
+        self._by_from.setdefault(delegation["from_actor"], {})[delegation_id] = None
+        self._by_to.setdefault(delegation["to_actor"], {})[delegation_id] = None
+
+    def _unindex_delegation(self, delegation: dict[str, Any]) -> None:
+        """Remove a delegation that stopped being active from the per-actor indexes"""
+        delegation_id = delegation["delegation_id"]
+        for index, actor_id in (
+            (self._by_from, delegation["from_actor"]),
+            (self._by_to, delegation["to_actor"]),
+        ):
+            ids = index.get(actor_id)
+            if ids is not None:
+                ids.pop(delegation_id, None)
+                if not ids:
+                    del index[actor_id]
+
+    def _add_active_edge(self, edge: DelegationEdge) -> None:
+        """Index a newly active edge"""
+        self._active_edges[edge.delegation_id] = edge
+        self.out_edges.setdefault(edge.from_actor, {})[edge.delegation_id] = edge
+        self.in_degrees[edge.to_actor] = self.in_degrees.get(edge.to_actor, 0) + 1
+        i = bisect_right(self._expiry_ns, edge.expires_ns)
+        self._expiry_ns.insert(i, edge.expires_ns)
+        self._expiry_ids.insert(i, edge.delegation_id)
+
+    def _remove_active_edge(self, edge: DelegationEdge) -> None:
+        """Drop an edge that stopped being active from the indexes"""
+        if self._active_edges.pop(edge.delegation_id, None) is None:
+            return
+        targets = self.out_edges[edge.from_actor]
+        del targets[edge.delegation_id]
+        if not targets:
+            del self.out_edges[edge.from_actor]
+
+        remaining = self.in_degrees[edge.to_actor] - 1
+        if remaining:
+            self.in_degrees[edge.to_actor] = remaining
+        else:
+            del self.in_degrees[edge.to_actor]
+
+        i = bisect_left(self._expiry_ns, edge.expires_ns)
+        i = self._expiry_ids.index(edge.delegation_id, i)
+        del self._expiry_ns[i]
+        del self._expiry_ids[i]
+
+    def _bulk_index_active_edges(self) -> None:
+        """
+        Build the active-edge indexes from self.edges in one pass
+
+        Used after bulk-loading edges (from_dict). Equivalent to calling
+        _add_active_edge() per edge, but the expiry columns are sorted once
+        instead of receiving one bisect insert (and list shift) per edge.
+        """
+        active = [edge for edge in self.edges.values() if edge.is_active]
+        self._active_edges = {edge.delegation_id: edge for edge in active}
+        for edge in active:
+            self.out_edges.setdefault(edge.from_actor, {})[edge.delegation_id] = edge
+            self.in_degrees[edge.to_actor] = self.in_degrees.get(edge.to_actor, 0) + 1
+        # Stable sort: ties keep delegation order, as repeated bisect_right inserts would
+        by_expiry = sorted(active, key=lambda edge: edge.expires_ns)
+        self._expiry_ns = [edge.expires_ns for edge in by_expiry]
+        self._expiry_ids = [edge.delegation_id for edge in by_expiry]
+
+    def _apply_decision_right_delegated(self, event: Event) -> None:
+        """Apply DecisionRightDelegated event"""
+        delegation_id = event.payload["delegation_id"]
+        self.delegations[delegation_id] = {
+            "delegation_id": delegation_id,
+            "workspace_id": event.payload["workspace_id"],
+            "from_actor": event.payload["from_actor"],
+            "to_actor": event.payload["to_actor"],
+            "delegated_at": event.payload["delegated_at"],
+            "ttl_days": event.payload["ttl_days"],
+            "expires_at": event.payload["expires_at"],
+            "renewable": event.payload.get("renewable", True),
+            "visibility": event.payload.get("visibility", "private"),
+            "purpose_tag": event.payload.get("purpose_tag"),
+            "is_active": True,
+            "revoked_at": None,
+            "version": event.version,
+        }
+        self._index_delegation(self.delegations[delegation_id])
+
+        # Add edge for graph analysis
+        edge = DelegationEdge(
+            delegation_id=delegation_id,
+            from_actor=event.payload["from_actor"],
+            to_actor=event.payload["to_actor"],
+            workspace_id=event.payload["workspace_id"],
+            expires_at=to_datetime(event.payload["expires_at"]),
+            is_active=True,
+        )
+        self.edges[delegation_id] = edge
+        self._add_active_edge(edge)
+
+    def _apply_delegation_revoked(self, event: Event) -> None:
+        """Apply DelegationRevoked event"""
+        delegation_id = event.payload["delegation_id"]
+        if delegation_id in self.delegations:
+            self.delegations[delegation_id]["is_active"] = False
+            self.delegations[delegation_id]["revoked_at"] = event.payload["revoked_at"]
+            self._unindex_delegation(self.delegations[delegation_id])
+            self._deactivate_edge(delegation_id)
+
+    def _apply_delegation_expired(self, event: Event) -> None:
+        """Apply DelegationExpired event"""
+        delegation_id = event.payload["delegation_id"]
+        if delegation_id in self.delegations:
+            self.delegations[delegation_id]["is_active"] = False
+            self._unindex_delegation(self.delegations[delegation_id])
+            self._deactivate_edge(delegation_id)
+
+    def _deactivate_edge(self, delegation_id: str) -> None:
+        """Mark a delegation's edge inactive and drop it from the indexes"""
+        edge = self.edges.get(delegation_id)
+        if edge is not None:
+            self._remove_active_edge(edge)
+            self.edges[delegation_id] = replace(edge, is_active=False)
+
+    # Event type -> handler, resolved with one dict lookup per event
+    _HANDLERS: ClassVar[dict[str, Callable[["DelegationGraph", Event], None]]] = {
+        "DecisionRightDelegated": _apply_decision_right_delegated,
+        "DelegationRevoked": _apply_delegation_revoked,
+        "DelegationExpired": _apply_delegation_expired,
+    }
 
     def get(self, delegation_id: str) -> dict[str, Any] | None:
         """Get delegation by ID"""
         return self.delegations.get(delegation_id)
 
+    def _expired_count(self, now_ns: int) -> int:
+        """Number of active edges whose expiry is at or before now_ns"""
+        return bisect_right(self._expiry_ns, now_ns)
+
     def get_active_edges(self, now: datetime) -> list[DelegationEdge]:
-        """Get currently active delegation edges"""
-        return [edge for edge in self.edges if edge.is_active and edge.expires_at > now]
+        """
+        Get currently active delegation edges
+
+        Reads the maintained active-edge index rather than every edge ever
+        recorded. While no active edge has passed its expiry the index is
+        returned as-is; otherwise the expired prefix of the expiry columns
+        is excluded. The index is never pruned by a query, so asking about
+        an earlier "now" stays exact.
+        """
+        now_ns = to_epoch_ns(now)
+        with self._lock:
+            expired = self._expired_count(now_ns)
+            if not expired:
+                return list(self._active_edges.values())
+            expired_ids = set(self._expiry_ids[:expired])
+            return [
+                edge
+                for delegation_id, edge in self._active_edges.items()
+                if delegation_id not in expired_ids
+            ]
+
+    def active_in_degrees(self, now: datetime) -> dict[str, int]:
+        """
+        In-degree per actor over currently active edges
+
+        Equivalent to compute_in_degrees(self.get_active_edges(now), now).
+        Starts from the maintained counts and subtracts only the edges in
+        the expired prefix, so the cost is proportional to the number of
+        expired-but-not-yet-revoked edges rather than to the graph size.
+        """
+        now_ns = to_epoch_ns(now)
+        with self._lock:
+            in_degrees = dict(self.in_degrees)
+            for delegation_id in self._expiry_ids[: self._expired_count(now_ns)]:
+                to_actor = self._active_edges[delegation_id].to_actor
+                remaining = in_degrees[to_actor] - 1
+                if remaining:
+                    in_degrees[to_actor] = remaining
+                else:
+                    del in_degrees[to_actor]
+        return in_degrees
+
+    def would_create_cycle(self, from_actor: str, to_actor: str, now: datetime) -> bool:
+        """
+        Check whether adding from_actor -> to_actor would close a cycle
+
+        Walks only the part of the maintained adjacency reachable from
+        to_actor, so the cost is bounded by that subgraph rather than by
+        the total number of edges ever recorded.
+        """
+        # O(1) guards from the maintained indexes: no walk is needed when
+        # to_actor delegates to nobody or nobody delegates to from_actor
+        if from_actor == to_actor:
+            return True
+
+        now_ns = to_epoch_ns(now)
+        with self._lock:
+            if to_actor not in self.out_edges or from_actor not in self.in_degrees:
+                return False
+
+            visited = {to_actor}
+            pending = [to_actor]
+
+            while pending:
+                node = pending.pop()
+                if node == from_actor:
+                    return True
+                for edge in self.out_edges.get(node, {}).values():
+                    if edge.expires_ns > now_ns and edge.to_actor not in visited:
+                        visited.add(edge.to_actor)
+                        pending.append(edge.to_actor)
+
+        return False
 
     def get_delegations_by_actor(self, actor_id: str) -> list[dict[str, Any]]:
         """Get all delegations from an actor"""
-        return [
-            d
-            for d in self.delegations.values()
-            if d["from_actor"] == actor_id and d["is_active"]
-        ]
+        with self._lock:
+            return [self.delegations[did] for did in self._by_from.get(actor_id, ())]
 
     def get_delegations_to_actor(self, actor_id: str) -> list[dict[str, Any]]:
         """Get all delegations to an actor"""
-        return [
-            d
-            for d in self.delegations.values()
-            if d["to_actor"] == actor_id and d["is_active"]
-        ]
+        with self._lock:
+            return [self.delegations[did] for did in self._by_to.get(actor_id, ())]
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dict for storage"""
@@ -168,115 +543,169 @@ class DelegationGraph:
                     "expires_at": e.expires_at.isoformat(),
                     "is_active": e.is_active,
                 }
-                for e in self.edges
+                for e in self.edges.values()
             ],
+            **self._watermark_to_dict(),
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "DelegationGraph":
+    def from_dict(cls, data: dict[str, Any]) -> Self:
         """Deserialize from dict"""
         graph = cls()
         graph.delegations = data.get("delegations", {})
-        graph.edges = [
-            DelegationEdge(
+        graph._restore_watermark(data)
+        for delegation in graph.delegations.values():
+            if delegation["is_active"]:
+                graph._index_delegation(delegation)
+        graph.edges = {
+            e["delegation_id"]: DelegationEdge(
                 delegation_id=e["delegation_id"],
                 from_actor=e["from_actor"],
                 to_actor=e["to_actor"],
                 workspace_id=e["workspace_id"],
-                expires_at=datetime.fromisoformat(e["expires_at"]),
+                expires_at=to_datetime(e["expires_at"]),
                 is_active=e["is_active"],
             )
             for e in data.get("edges", [])
-        ]
+        }
+        graph._bulk_index_active_edges()
         return graph
 
 
-class LawRegistry:
+class LawRegistry(_VersionedProjection):
     """
     Projection: Registry of all laws
 
     Maintains current state of all laws with efficient lookup
     for activation, review tracking, and querying.
+
+    next_checkpoint_at is stored as it arrived in the event payload
+    (normally an ISO string), and additionally parsed once into
+    _checkpoint_ns so review queries compare integers instead of
+    re-parsing timestamps on every call.
+
+    _by_status buckets law ids by status so status queries visit only the
+    laws in that status; every status change goes through _move_status().
     """
 
     def __init__(self) -> None:
+        super().__init__()
         self.laws: dict[str, dict[str, Any]] = {}
-
-    def apply_event(self, event: Event) -> None:
-        """Apply an event to update projection state"""
-        if event.event_type == "LawCreated":
-            law_id = event.payload["law_id"]
-            self.laws[law_id] = {
-                "law_id": law_id,
-                "workspace_id": event.payload["workspace_id"],
-                "title": event.payload["title"],
-                "scope": event.payload.get("scope", {}),
-                "reversibility_class": event.payload["reversibility_class"],
-                "checkpoints": event.payload["checkpoints"],
-                "params": event.payload.get("params", {}),
-                "status": "DRAFT",
-                "created_at": event.payload["created_at"],
-                "created_by": event.payload.get("created_by"),
-                "activated_at": None,
-                "next_checkpoint_at": None,
-                "next_checkpoint_index": 0,
-                "version": event.version,
-            }
-
-        elif event.event_type == "LawActivated":
-            law_id = event.payload["law_id"]
-            if law_id in self.laws:
-                self.laws[law_id]["status"] = "ACTIVE"
-                self.laws[law_id]["activated_at"] = event.payload["activated_at"]
-                self.laws[law_id]["next_checkpoint_at"] = event.payload[
-                    "next_checkpoint_at"
-                ]
-                self.laws[law_id]["next_checkpoint_index"] = event.payload[
-                    "next_checkpoint_index"
-                ]
-                self.laws[law_id]["version"] = event.version
-
-        elif event.event_type == "LawReviewTriggered":
-            law_id = event.payload["law_id"]
-            if law_id in self.laws:
-                self.laws[law_id]["status"] = "REVIEW"
-                self.laws[law_id]["review_triggered_at"] = event.payload.get("triggered_at")
-                self.laws[law_id]["version"] = event.version
-
-        elif event.event_type == "LawReviewCompleted":
-            law_id = event.payload["law_id"]
-            if law_id in self.laws:
-                outcome = event.payload["outcome"]
-                if outcome == "continue":
-                    self.laws[law_id]["status"] = "ACTIVE"
-                    self.laws[law_id]["next_checkpoint_at"] = event.payload.get(
-                        "next_checkpoint_at"
-                    )
-                elif outcome == "adjust":
-                    self.laws[law_id]["status"] = "ADJUST"
-                elif outcome == "sunset":
-                    self.laws[law_id]["status"] = "SUNSET"
-                self.laws[law_id]["version"] = event.version
-
-        elif event.event_type == "LawAdjusted":
-            law_id = event.payload["law_id"]
-            if law_id in self.laws:
-                self.laws[law_id]["status"] = "ADJUST"
-                self.laws[law_id]["version"] = event.version
-
-        elif event.event_type == "LawSunsetScheduled":
-            law_id = event.payload["law_id"]
-            if law_id in self.laws:
-                self.laws[law_id]["status"] = "SUNSET"
-                self.laws[law_id]["sunset_at"] = event.payload.get("sunset_at")
-                self.laws[law_id]["version"] = event.version
-
-        elif event.event_type == "LawArchived":
-            law_id = event.payload["law_id"]
-            if law_id in self.laws:
-                self.laws[law_id]["status"] = "ARCHIVED"
-                self.laws[law_id]["archived_at"] = event.payload.get("archived_at")
-                self.laws[law_id]["version"] = event.version
+        # law_id -> next checkpoint as epoch nanoseconds (laws with one only)
+        self._checkpoint_ns: dict[str, int] = {}
+        # status -> ids of laws in that status (dicts as ordered sets)
+        self._by_status: dict[str, dict[str, None]] = {}
+
+    def _move_status(self, law_id: str, new_status: str) -> None:
+        """Change a law's status and keep the status buckets coherent"""
+        law = self.laws[law_id]
+        if law["status"] == new_status:
+            return
+        old_bucket = self._by_status.get(law["status"])
+        if old_bucket is not None:
+            old_bucket.pop(law_id, None)
+        law["status"] = new_status
+        self._by_status.setdefault(new_status, {})[law_id] = None
+
+    def _set_next_checkpoint(self, law_id: str, next_checkpoint_at: Any) -> None:
+        """Record a law's next checkpoint, parsing it once for the review queries"""
+        self.laws[law_id]["next_checkpoint_at"] = next_checkpoint_at
+        if not next_checkpoint_at:
+            self._checkpoint_ns.pop(law_id, None)
+            return
+        self._checkpoint_ns[law_id] = to_epoch_ns(to_datetime(next_checkpoint_at))
+
+    def _apply_law_created(self, event: Event) -> None:
+        """Apply LawCreated event"""
+        law_id = event.payload["law_id"]
+        self.laws[law_id] = {
+            "law_id": law_id,
+            "workspace_id": event.payload["workspace_id"],
+            "title": event.payload["title"],
+            "scope": event.payload.get("scope", {}),
+            "reversibility_class": event.payload["reversibility_class"],
+            "checkpoints": event.payload["checkpoints"],
+            "params": event.payload.get("params", {}),
+            "status": "DRAFT",
+            "created_at": event.payload["created_at"],
+            "created_by": event.payload.get("created_by"),
+            "activated_at": None,
+            "next_checkpoint_at": None,
+            "next_checkpoint_index": 0,
+            "version": event.version,
+        }
+        self._by_status.setdefault("DRAFT", {})[law_id] = None
+
+    def _apply_law_activated(self, event: Event) -> None:
+        """Apply LawActivated event"""
+        law_id = event.payload["law_id"]
+        if law_id in self.laws:
+            self._move_status(law_id, "ACTIVE")
+            self.laws[law_id]["activated_at"] = event.payload["activated_at"]
+            self._set_next_checkpoint(law_id, event.payload["next_checkpoint_at"])
+            self.laws[law_id]["next_checkpoint_index"] = event.payload["next_checkpoint_index"]
+            self.laws[law_id]["version"] = event.version
+
+    def _apply_law_review_triggered(self, event: Event) -> None:
+        """Apply LawReviewTriggered event"""
+        law_id = event.payload["law_id"]
+        if law_id in self.laws:
+            self._move_status(law_id, "REVIEW")
+            self.laws[law_id]["review_triggered_at"] = event.payload.get("triggered_at")
+            self.laws[law_id]["version"] = event.version
+
+    def _apply_law_review_completed(self, event: Event) -> None:
+        """Apply LawReviewCompleted event"""
+        law_id = event.payload["law_id"]
+        if law_id in self.laws:
+            outcome = event.payload["outcome"]
+            if outcome == "continue":
+                self._move_status(law_id, "ACTIVE")
+                self._set_next_checkpoint(law_id, event.payload.get("next_checkpoint_at"))
+                # Older events predate the index field; keep the stored one
+                if event.payload.get("next_checkpoint_index") is not None:
+                    self.laws[law_id]["next_checkpoint_index"] = event.payload[
+                        "next_checkpoint_index"
+                    ]
+            elif outcome == "adjust":
+                self._move_status(law_id, "ADJUST")
+            elif outcome == "sunset":
+                self._move_status(law_id, "SUNSET")
+            self.laws[law_id]["version"] = event.version
+
+    def _apply_law_adjusted(self, event: Event) -> None:
+        """Apply LawAdjusted event"""
+        law_id = event.payload["law_id"]
+        if law_id in self.laws:
+            self._move_status(law_id, "ADJUST")
+            self.laws[law_id]["version"] = event.version
+
+    def _apply_law_sunset_scheduled(self, event: Event) -> None:
+        """Apply LawSunsetScheduled event"""
+        law_id = event.payload["law_id"]
+        if law_id in self.laws:
+            self._move_status(law_id, "SUNSET")
+            self.laws[law_id]["sunset_at"] = event.payload.get("sunset_at")
+            self.laws[law_id]["version"] = event.version
+
+    def _apply_law_archived(self, event: Event) -> None:
+        """Apply LawArchived event"""
+        law_id = event.payload["law_id"]
+        if law_id in self.laws:
+            self._move_status(law_id, "ARCHIVED")
+            self.laws[law_id]["archived_at"] = event.payload.get("archived_at")
+            self.laws[law_id]["version"] = event.version
+
+    # Event type -> handler, resolved with one dict lookup per event
+    _HANDLERS: ClassVar[dict[str, Callable[["LawRegistry", Event], None]]] = {
+        "LawCreated": _apply_law_created,
+        "LawActivated": _apply_law_activated,
+        "LawReviewTriggered": _apply_law_review_triggered,
+        "LawReviewCompleted": _apply_law_review_completed,
+        "LawAdjusted": _apply_law_adjusted,
+        "LawSunsetScheduled": _apply_law_sunset_scheduled,
+        "LawArchived": _apply_law_archived,
+    }
 
     def get(self, law_id: str) -> dict[str, Any] | None:
         """Get law by ID"""
@@ -284,7 +713,14 @@ class LawRegistry:
 
     def list_by_status(self, status: LawStatus) -> list[dict[str, Any]]:
         """List laws by status"""
-        return [law for law in self.laws.values() if law["status"] == status.value]
+        return list(self._laws_with_status(status.value))
+
+    def _laws_with_status(self, status: str) -> tuple[dict[str, Any], ...]:
+        """Snapshot of the laws currently in a status"""
+        return self._snapshot(
+            ("status", status),
+            lambda: [self.laws[law_id] for law_id in self._by_status.get(status, ())],
+        )
 
     def list_active(self) -> list[dict[str, Any]]:
         """List all active laws"""
@@ -292,25 +728,46 @@ class LawRegistry:
 
     def list_overdue_reviews(self, now: datetime) -> list[dict[str, Any]]:
         """List laws with overdue review checkpoints"""
-        overdue = []
-        for law in self.laws.values():
-            if law["status"] == "ACTIVE" and law["next_checkpoint_at"]:
-                checkpoint_dt = (
-                    datetime.fromisoformat(law["next_checkpoint_at"])
-                    if isinstance(law["next_checkpoint_at"], str)
-                    else law["next_checkpoint_at"]
-                )
-                if now > checkpoint_dt:
-                    overdue.append(law)
-        return overdue
+        now_ns = to_epoch_ns(now)
+        checkpoint_ns = self._checkpoint_ns
+        # A law without a checkpoint defaults to now, which never matches
+        return [
+            law
+            for law in self._laws_with_status("ACTIVE")
+            if now_ns > checkpoint_ns.get(law["law_id"], now_ns)
+        ]
+
+    def list_upcoming_reviews(self, now: datetime, days: int) -> list[dict[str, Any]]:
+        """
+        List active laws whose next checkpoint falls within the next N days
+
+        Args:
+            now: Current time
+            days: Window length in days (now exclusive, now + days inclusive)
+
+        Returns:
+            Active laws with now < next_checkpoint_at <= now + days
+        """
+        now_ns = to_epoch_ns(now)
+        until_ns = now_ns + days * NS_PER_DAY
+        checkpoint_ns = self._checkpoint_ns
+        return [
+            law
+            for law in self._laws_with_status("ACTIVE")
+            if now_ns < checkpoint_ns.get(law["law_id"], now_ns) <= until_ns
+        ]
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dict for storage"""
-        return {"laws": self.laws}
+        return {"laws": self.laws, **self._watermark_to_dict()}
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "LawRegistry":
+    def from_dict(cls, data: dict[str, Any]) -> Self:
         """Deserialize from dict"""
         registry = cls()
         registry.laws = data.get("laws", {})
+        registry._restore_watermark(data)
+        for law_id, law in registry.laws.items():
+            registry._by_status.setdefault(law["status"], {})[law_id] = None
+            registry._set_next_checkpoint(law_id, law.get("next_checkpoint_at"))
         return registry
@@ -9,7 +9,8 @@ Usage:
 """
 
 import argparse
-import time
+import signal
+import threading
 
 from freedom_that_lasts.kernel.logging import configure_logging, get_logger
 from freedom_that_lasts.kernel.metrics import start_metrics_server
@@ -60,12 +61,14 @@ def main() -> None:
 
     logger.info("Metrics server started successfully")
 
-    # Keep the server running
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        logger.info("Shutting down metrics server")
+    # Block until SIGTERM (container/systemd stop) or SIGINT (Ctrl+C);
+    # no periodic wake-ups while serving
+    shutdown = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: shutdown.set())
+    signal.signal(signal.SIGINT, lambda *_: shutdown.set())
+    shutdown.wait()
+
+    logger.info("Shutting down metrics server")
 
 
 if __name__ == "__main__":
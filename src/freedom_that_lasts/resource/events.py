@@ -17,12 +17,24 @@ from pydantic import BaseModel, Field
 from freedom_that_lasts.resource.models import SelectionMethod
 
 
+class _EventPayload(BaseModel):
+    """
+    Base for resource event payloads
+
+    Payloads are built once by a handler or trigger and immediately dumped,
+    so they are frozen (no accidental mutation between build and dump) and
+    reject unknown fields (schema drift fails loudly instead of being dropped).
+    """
+
+    model_config = {"frozen": True, "extra": "forbid"}
+
+
 # ============================================================================
 # Supplier & Capability Events
 # ============================================================================
 
 
-class SupplierRegistered(BaseModel):
+class SupplierRegistered(_EventPayload):
     """Supplier registered in capability registry"""
 
     supplier_id: str = Field(..., description="Unique supplier identifier")
@@ -35,7 +47,7 @@ class SupplierRegistered(BaseModel):
     )
 
 
-class CapabilityClaimAdded(BaseModel):
+class CapabilityClaimAdded(_EventPayload):
     """Capability claim added to supplier with evidence"""
 
     claim_id: str = Field(..., description="Unique claim identifier")
@@ -54,7 +66,7 @@ class CapabilityClaimAdded(BaseModel):
     added_by: str = Field(..., description="Actor who added claim")
 
 
-class CapabilityClaimUpdated(BaseModel):
+class CapabilityClaimUpdated(_EventPayload):
     """Capability claim updated (evidence, validity, capacity)"""
 
     claim_id: str = Field(..., description="Claim identifier")
@@ -72,7 +84,7 @@ class CapabilityClaimUpdated(BaseModel):
     updated_by: str = Field(..., description="Actor who updated claim")
 
 
-class CapabilityClaimRevoked(BaseModel):
+class CapabilityClaimRevoked(_EventPayload):
     """Capability claim revoked (evidence invalid or capability lost)"""
 
     claim_id: str = Field(..., description="Revoked claim identifier")
@@ -88,7 +100,7 @@ class CapabilityClaimRevoked(BaseModel):
 # ============================================================================
 
 
-class TenderCreated(BaseModel):
+class TenderCreated(_EventPayload):
     """Tender created for law-mandated procurement"""
 
     tender_id: str = Field(..., description="Unique tender identifier")
@@ -121,7 +133,7 @@ class TenderCreated(BaseModel):
     created_by: str = Field(..., description="Creator actor")
 
 
-class TenderOpened(BaseModel):
+class TenderOpened(_EventPayload):
     """Tender opened for submissions (DRAFT → OPEN)"""
 
     tender_id: str = Field(..., description="Tender identifier")
@@ -129,7 +141,7 @@ class TenderOpened(BaseModel):
     opened_by: str = Field(..., description="Actor who opened tender")
 
 
-class FeasibleSetComputed(BaseModel):
+class FeasibleSetComputed(_EventPayload):
     """
     Feasible set computed via binary requirement matching
 
@@ -156,7 +168,7 @@ class FeasibleSetComputed(BaseModel):
     computed_by: str = Field(..., description="System or actor")
 
 
-class SupplierSelected(BaseModel):
+class SupplierSelected(_EventPayload):
     """
     Supplier selected from feasible set via constitutional mechanism
 
@@ -183,7 +195,7 @@ class SupplierSelected(BaseModel):
     selected_by: str = Field(..., description="System or actor")
 
 
-class SupplierSelectionFailed(BaseModel):
+class SupplierSelectionFailed(_EventPayload):
     """Supplier selection failed (empty feasible set or other issue)"""
 
     tender_id: str = Field(..., description="Tender identifier")
@@ -195,7 +207,7 @@ class SupplierSelectionFailed(BaseModel):
     attempted_by: str = Field(..., description="System or actor")
 
 
-class TenderAwarded(BaseModel):
+class TenderAwarded(_EventPayload):
     """Tender awarded to selected supplier with contract terms"""
 
     tender_id: str = Field(..., description="Tender identifier")
@@ -206,7 +218,7 @@ class TenderAwarded(BaseModel):
     awarded_by: str = Field(..., description="Actor who awarded")
 
 
-class TenderCancelled(BaseModel):
+class TenderCancelled(_EventPayload):
     """Tender cancelled before completion"""
 
     tender_id: str = Field(..., description="Tender identifier")
@@ -220,7 +232,7 @@ class TenderCancelled(BaseModel):
 # ============================================================================
 
 
-class MilestoneRecorded(BaseModel):
+class MilestoneRecorded(_EventPayload):
     """Delivery milestone recorded with evidence"""
 
     tender_id: str = Field(..., description="Tender identifier")
@@ -237,7 +249,7 @@ class MilestoneRecorded(BaseModel):
     )
 
 
-class SLABreachDetected(BaseModel):
+class SLABreachDetected(_EventPayload):
     """SLA breach detected during delivery"""
 
     tender_id: str = Field(..., description="Tender identifier")
@@ -249,7 +261,7 @@ class SLABreachDetected(BaseModel):
     detected_at: datetime = Field(..., description="Detection timestamp")
 
 
-class TenderCompleted(BaseModel):
+class TenderCompleted(_EventPayload):
     """Tender completed with quality assessment"""
 
     tender_id: str = Field(..., description="Tender identifier")
@@ -263,7 +275,7 @@ class TenderCompleted(BaseModel):
     completed_by: str = Field(..., description="Actor who completed")
 
 
-class ReputationUpdated(BaseModel):
+class ReputationUpdated(_EventPayload):
     """
     Supplier reputation updated based on delivery performance
 
@@ -286,7 +298,7 @@ class ReputationUpdated(BaseModel):
 # ============================================================================
 
 
-class EmptyFeasibleSetDetected(BaseModel):
+class EmptyFeasibleSetDetected(_EventPayload):
     """
     Empty feasible set detected - no suppliers meet requirements
 
@@ -309,7 +321,7 @@ class EmptyFeasibleSetDetected(BaseModel):
     )
 
 
-class SupplierConcentrationWarning(BaseModel):
+class SupplierConcentrationWarning(_EventPayload):
     """
     Supplier concentration warning - single supplier approaching limit
 
@@ -334,7 +346,7 @@ class SupplierConcentrationWarning(BaseModel):
     )
 
 
-class SupplierConcentrationHalt(BaseModel):
+class SupplierConcentrationHalt(_EventPayload):
     """
     Supplier concentration halt - single supplier exceeded critical limit
 
@@ -9,15 +9,301 @@ who developed the first binary number system for Sanskrit poetry metrics - we're
 it to prevent procurement corruption 2300 years later!
 """
 
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
+from freedom_that_lasts.kernel.time import to_datetime, to_epoch_ns
+
+
+def _to_naive(dt: datetime) -> datetime:
+    """Drop tzinfo so aware and naive timestamps compare (wall-clock, as stored)"""
+    return dt.replace(tzinfo=None) if dt.tzinfo else dt
+
+
+def _wall_ns(dt: datetime) -> int:
+    """Wall-clock nanoseconds of a datetime (tzinfo dropped, as stored)"""
+    return to_epoch_ns(_to_naive(dt))
+
+
+@lru_cache(maxsize=4096)
+def _parse_wall_ns_iso(value: str) -> int:
+    """Parse an ISO 8601 string straight to wall-clock nanoseconds (cached per string)"""
+    return _wall_ns(datetime.fromisoformat(value))
+
+
+def _parse_wall_ns(value: datetime | str) -> int:
+    """Coerce a claim timestamp (ISO string or datetime) to wall-clock nanoseconds"""
+    return _parse_wall_ns_iso(value) if isinstance(value, str) else _wall_ns(value)
+
+
+def _try_float(value: Any) -> float | None:
+    """Numeric value of a capacity figure, or None if it is not numeric"""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _capacity_values(capacity: dict[str, Any] | None) -> dict[str, tuple[Any, float | None]]:
+    """Pair every capacity figure with its float, parsed once (None if non-numeric)"""
+    return {key: (value, _try_float(value)) for key, value in capacity.items()} if capacity else {}
+
+
+def _capacity_maxima(capabilities: dict[str, dict[str, Any]]) -> dict[str, float]:
+    """
+    Maximum numeric value of every capacity metric across a supplier's claims
+
+    One pass over all claims, instead of one pass per required metric.
+    Non-numeric values are ignored.
+    """
+    maxima: dict[str, float] = {}
+    for claim in capabilities.values():
+        for capacity_key, capacity_value in (claim.get("capacity") or {}).items():
+            capacity_float = _try_float(capacity_value)
+            if capacity_float is None:
+                continue
+            current = maxima.get(capacity_key)
+            if current is None or capacity_float > current:
+                maxima[capacity_key] = capacity_float
+    return maxima
+
+
+@dataclass(slots=True, frozen=True)
+class _ClaimView:
+    """
+    A capability claim normalized once for one feasible-set evaluation
+
+    Holds validity bounds as wall-clock nanoseconds (for comparisons) plus
+    the raw values (parsed only when a reason message needs them), the ids
+    of evidence already expired at the evaluation time, and the
+    verification / capacity fields (capacity as (raw, float) pairs).
+    """
+
+    valid_from: datetime | str | None
+    valid_until: datetime | str | None
+    valid_from_ns: int | None
+    valid_until_ns: int | None
+    expired_evidence_ids: list[str]
+    verified: bool
+    capacity: dict[str, tuple[Any, float | None]]
+
+    @classmethod
+    def from_claim(cls, claim: dict[str, Any], eval_ns: int) -> "_ClaimView":
+        """Parse a claim dict (ISO strings or datetimes) against an evaluation time"""
+        valid_from = claim.get("valid_from") or None
+        valid_until = claim.get("valid_until") or None
+
+        expired_evidence_ids = []
+        for ev in claim.get("evidence", []):
+            ev_valid_until = ev.get("valid_until")
+            if ev_valid_until and eval_ns > _parse_wall_ns(ev_valid_until):
+                expired_evidence_ids.append(ev["evidence_id"])
+
+        return cls(
+            valid_from=valid_from,
+            valid_until=valid_until,
+            valid_from_ns=_parse_wall_ns(valid_from) if valid_from else None,
+            valid_until_ns=_parse_wall_ns(valid_until) if valid_until else None,
+            expired_evidence_ids=expired_evidence_ids,
+            verified=claim.get("verified", False),
+            capacity=_capacity_values(claim.get("capacity")),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class _NormalizedRequirement:
+    """
+    A tender requirement normalized once, before the supplier loop
+
+    Carries the loop-invariant fields every supplier is checked against,
+    with capacity thresholds preparsed to (raw, float) pairs.
+    """
+
+    capability_type: str
+    min_capacity: dict[str, Any] | None
+    min_capacity_values: dict[str, tuple[Any, float | None]]
+
+    @classmethod
+    def from_requirement(cls, requirement: dict[str, Any]) -> "_NormalizedRequirement":
+        """Normalize a requirement dict from the tender"""
+        min_capacity = requirement.get("min_capacity")
+        return cls(
+            capability_type=requirement["capability_type"],
+            min_capacity=min_capacity,
+            min_capacity_values=_capacity_values(min_capacity),
+        )
+
+
+def _normalize_requirements(requirements: list[dict[str, Any]]) -> list[_NormalizedRequirement]:
+    """Normalize the mandatory requirements (optional ones can never exclude a supplier)"""
+    return [
+        _NormalizedRequirement.from_requirement(requirement)
+        for requirement in requirements
+        if requirement.get("mandatory", True)
+    ]
+
+
+class CapabilityIndex:
+    """
+    Inverted index: capability type -> ids of suppliers claiming it
+
+    Lets feasibility-only evaluations reject suppliers that lack a mandatory
+    capability before any claim is parsed. Must be built from the same
+    supplier rows that are passed to compute_feasible_set.
+    """
+
+    __slots__ = ("_by_type",)
+
+    def __init__(self, by_type: dict[str, frozenset[str]]) -> None:
+        self._by_type = by_type
+
+    @classmethod
+    def from_suppliers(cls, suppliers: list[dict[str, Any]]) -> "CapabilityIndex":
+        """Build the index from supplier registry rows"""
+        by_type: dict[str, set[str]] = {}
+        for supplier in suppliers:
+            for capability_type in supplier.get("capabilities", {}):
+                by_type.setdefault(capability_type, set()).add(supplier["supplier_id"])
+        return cls({ct: frozenset(ids) for ct, ids in by_type.items()})
+
+    def suppliers_with(self, capability_type: str) -> frozenset[str]:
+        """Ids of suppliers claiming a capability type (empty if none)"""
+        return self._by_type.get(capability_type, frozenset())
+
+
+# Reason templates per failure code: compute_feasible_set names the capability
+# in every reason (one supplier, many requirements); check_supplier_meets_requirement
+# reports on a single, already-known requirement
+_FEASIBLE_SET_REASONS = {
+    "missing": "Missing required capability: {capability_type}",
+    "not_yet_valid": "Capability {capability_type} not yet valid (valid from {valid_from})",
+    "expired": "Capability {capability_type} expired (valid until {valid_until})",
+    "evidence_expired": "Capability {capability_type} has expired evidence: {evidence_ids}",
+    "unverified": "Capability {capability_type} evidence not yet verified",
+    "no_capacity_data": (
+        "Capability {capability_type} missing capacity data (required: {min_capacity})"
+    ),
+    "missing_metric": "Capability {capability_type} missing capacity metric: {key}",
+    "insufficient": (
+        "Capability {capability_type} insufficient capacity: {key}={actual} < {minimum}"
+    ),
+    "mismatch": "Capability {capability_type} capacity mismatch: {key}={actual} != {minimum}",
+}
+
+_CHECK_REASONS = {
+    "missing": "Missing capability: {capability_type}",
+    "not_yet_valid": "Capability not yet valid (valid from {valid_from})",
+    "expired": "Capability expired (valid until {valid_until})",
+    "evidence_expired": "Evidence {evidence_id} expired",
+    "unverified": "Evidence not yet verified",
+    "no_capacity_data": "Missing capacity data",
+    "missing_metric": "Missing capacity metric: {key}",
+    "insufficient": "Insufficient capacity: {key}={actual} < {minimum}",
+    "mismatch": "Capacity mismatch: {key}={actual} != {minimum}",
+}
+
+
+def _requirement_failure(
+    view: _ClaimView | None,
+    requirement: _NormalizedRequirement,
+    eval_ns: int,
+) -> tuple[str, dict[str, Any]] | None:
+    """
+    Evaluate one (supplier, requirement) cell of the feasibility matrix
+
+    Single implementation behind both compute_feasible_set and
+    check_supplier_meets_requirement; each formats failures with its own
+    reason templates.
+
+    Args:
+        view: Supplier's normalized claim for the required capability (None if absent)
+        requirement: Normalized requirement
+        eval_ns: Evaluation time as wall-clock nanoseconds
+
+    Returns:
+        None if the requirement is met, otherwise (failure code, template fields)
+    """
+    capability_type = requirement.capability_type
+
+    if view is None:
+        return "missing", {"capability_type": capability_type}
+
+    # Each raw bound is set whenever its _ns is (the reason shows the raw value)
+    if (
+        view.valid_from is not None
+        and view.valid_from_ns is not None
+        and eval_ns < view.valid_from_ns
+    ):
+        return "not_yet_valid", {
+            "capability_type": capability_type,
+            "valid_from": to_datetime(view.valid_from),
+        }
+
+    if (
+        view.valid_until is not None
+        and view.valid_until_ns is not None
+        and eval_ns > view.valid_until_ns
+    ):
+        return "expired", {
+            "capability_type": capability_type,
+            "valid_until": to_datetime(view.valid_until),
+        }
+
+    # Check evidence not expired
+    if view.expired_evidence_ids:
+        return "evidence_expired", {
+            "capability_type": capability_type,
+            "evidence_id": view.expired_evidence_ids[0],
+            "evidence_ids": ", ".join(view.expired_evidence_ids),
+        }
+
+    # Check evidence verification status
+    if not view.verified:
+        return "unverified", {"capability_type": capability_type}
+
+    # Check minimum capacity requirements (if specified for this requirement)
+    min_capacity = requirement.min_capacity
+    if min_capacity:
+        if not view.capacity:
+            return "no_capacity_data", {
+                "capability_type": capability_type,
+                "min_capacity": min_capacity,
+            }
+
+        # Check each capacity constraint
+        for capacity_key, (min_value, min_float) in requirement.min_capacity_values.items():
+            actual = view.capacity.get(capacity_key)
+            if actual is None or actual[0] is None:
+                return "missing_metric", {"capability_type": capability_type, "key": capacity_key}
+            actual_value, actual_float = actual
+
+            # Simple comparison for numeric values
+            # In practice, this should be type-aware (units, etc.)
+            if actual_float is not None and min_float is not None:
+                code, failed = "insufficient", actual_float < min_float
+            else:
+                # Non-numeric comparison - do string comparison
+                code, failed = "mismatch", str(actual_value) != str(min_value)
+            if failed:
+                return code, {
+                    "capability_type": capability_type,
+                    "key": capacity_key,
+                    "actual": actual_value,
+                    "minimum": min_value,
+                }
+
+    return None
+
 
 def compute_feasible_set(
     suppliers: list[dict[str, Any]],
     requirements: list[dict[str, Any]],
     required_capacity: dict[str, Any] | None,
     evaluation_time: datetime,
+    collect_all_reasons: bool = False,
+    capability_index: CapabilityIndex | None = None,
 ) -> tuple[list[str], list[dict[str, Any]]]:
     """
     Compute feasible set via binary requirement matching
@@ -34,6 +320,16 @@ def compute_feasible_set(
         requirements: List of requirement dictionaries from tender
         required_capacity: Overall capacity requirements (optional)
         evaluation_time: Time to check evidence expiration against
+        collect_all_reasons: Record every violation per excluded supplier (for
+            audit events); by default stop at the first one, which already
+            decides exclusion
+        capability_index: Prebuilt index over the same suppliers (optional; built
+            on demand). Only used when not collecting all reasons: suppliers
+            lacking a mandatory capability are then checked requirement by
+            requirement, parsing claims only up to the first failure, so the
+            reason is the same as without an index. The index only narrows
+            work: a stale one never changes the result. The procurement handlers
+            collect all reasons for the audit event, so they never take this path
 
     Returns:
         Tuple of (feasible_supplier_ids[], excluded_with_reasons[])
@@ -48,156 +344,78 @@ def compute_feasible_set(
     feasible_suppliers: list[str] = []
     excluded_suppliers: list[dict[str, Any]] = []
 
+    # Normalize evaluation time once (all comparisons are wall-clock integer ns)
+    eval_ns = _wall_ns(evaluation_time)
+
+    # Optional requirements never exclude a supplier, so only mandatory
+    # ones are evaluated (the columns of the supplier x requirement matrix),
+    # each normalized once rather than re-read per supplier
+    mandatory_requirements = _normalize_requirements(requirements)
+    required_types = {requirement.capability_type for requirement in mandatory_requirements}
+
+    # Candidates = suppliers claiming every mandatory capability type
+    candidates: frozenset[str] | None = None
+    if not collect_all_reasons and mandatory_requirements:
+        index = capability_index or CapabilityIndex.from_suppliers(suppliers)
+        candidates = frozenset.intersection(
+            *(index.suppliers_with(req.capability_type) for req in mandatory_requirements)
+        )
+
     # Check each supplier against ALL requirements (universal quantification)
     for supplier in suppliers:
         supplier_id = supplier["supplier_id"]
-        reasons: list[str] = []
-
-        # Check ALL requirements (binary AND - all must be true)
-        for requirement in requirements:
-            capability_type = requirement["capability_type"]
-            mandatory = requirement.get("mandatory", True)
 
-            # Get supplier's capability claim
+        if candidates is not None and supplier_id not in candidates:
+            # The index says a capability is missing: report the first failure
+            # in requirement order, parsing claims only up to it
             capabilities = supplier.get("capabilities", {})
-
-            if capability_type not in capabilities:
-                if mandatory:
-                    reasons.append(f"Missing required capability: {capability_type}")
-                continue
-
-            claim = capabilities[capability_type]
-
-            # Check claim validity at evaluation time
-            valid_from = claim.get("valid_from")
-            valid_until = claim.get("valid_until")
-
-            # Convert strings to datetime for comparison
-            if valid_from and isinstance(valid_from, str):
-                valid_from = datetime.fromisoformat(valid_from)
-            if valid_until and isinstance(valid_until, str):
-                valid_until = datetime.fromisoformat(valid_until)
-
-            # Normalize timezone awareness for comparison
-            # Make all datetimes timezone-naive for comparison
-            eval_time_naive = evaluation_time.replace(tzinfo=None) if evaluation_time.tzinfo else evaluation_time
-            valid_from_naive = valid_from.replace(tzinfo=None) if (valid_from and valid_from.tzinfo) else valid_from
-            valid_until_naive = valid_until.replace(tzinfo=None) if (valid_until and valid_until.tzinfo) else valid_until
-
-            if valid_from_naive and eval_time_naive < valid_from_naive:
-                if mandatory:
-                    reasons.append(
-                        f"Capability {capability_type} not yet valid "
-                        f"(valid from {valid_from})"
-                    )
-                continue
-
-            if valid_until_naive and eval_time_naive > valid_until_naive:
-                if mandatory:
-                    reasons.append(
-                        f"Capability {capability_type} expired "
-                        f"(valid until {valid_until})"
-                    )
-                continue
-
-            # Check evidence not expired
-            evidence = claim.get("evidence", [])
-            expired_evidence = []
-            for ev in evidence:
-                ev_valid_until = ev.get("valid_until")
-                # Convert string to datetime if needed
-                if ev_valid_until and isinstance(ev_valid_until, str):
-                    ev_valid_until = datetime.fromisoformat(ev_valid_until)
-                # Normalize timezone for comparison
-                ev_valid_until_naive = ev_valid_until.replace(tzinfo=None) if (ev_valid_until and ev_valid_until.tzinfo) else ev_valid_until
-                if ev_valid_until_naive and eval_time_naive > ev_valid_until_naive:
-                    expired_evidence.append(ev["evidence_id"])
-
-            if expired_evidence:
-                if mandatory:
-                    reasons.append(
-                        f"Capability {capability_type} has expired evidence: "
-                        f"{', '.join(expired_evidence)}"
-                    )
+            failure = None
+            for requirement in mandatory_requirements:
+                claim = capabilities.get(requirement.capability_type)
+                view = _ClaimView.from_claim(claim, eval_ns) if claim is not None else None
+                failure = _requirement_failure(view, requirement, eval_ns)
+                if failure is not None:
+                    break
+            if failure is not None:
+                code, fields = failure
+                excluded_suppliers.append(
+                    {
+                        "supplier_id": supplier_id,
+                        "reasons": [_FEASIBLE_SET_REASONS[code].format(**fields)],
+                    }
+                )
                 continue
+            # Stale or mismatched index: fall through to the full evaluation
 
-            # Check evidence verification status
-            verified = claim.get("verified", False)
-            if not verified:
-                if mandatory:
-                    reasons.append(
-                        f"Capability {capability_type} evidence not yet verified"
-                    )
-                continue
-
-            # Check minimum capacity requirements (if specified for this requirement)
-            min_capacity = requirement.get("min_capacity")
-            if min_capacity:
-                claim_capacity = claim.get("capacity")
-                if not claim_capacity:
-                    if mandatory:
-                        reasons.append(
-                            f"Capability {capability_type} missing capacity data "
-                            f"(required: {min_capacity})"
-                        )
-                    continue
-
-                # Check each capacity constraint
-                capacity_met = True
-                for capacity_key, min_value in min_capacity.items():
-                    actual_value = claim_capacity.get(capacity_key)
-                    if actual_value is None:
-                        if mandatory:
-                            reasons.append(
-                                f"Capability {capability_type} missing capacity metric: "
-                                f"{capacity_key}"
-                            )
-                        capacity_met = False
-                        break
-
-                    # Simple comparison for numeric values
-                    # In practice, this should be type-aware (units, etc.)
-                    try:
-                        if float(actual_value) < float(min_value):
-                            if mandatory:
-                                reasons.append(
-                                    f"Capability {capability_type} insufficient capacity: "
-                                    f"{capacity_key}={actual_value} < {min_value}"
-                                )
-                            capacity_met = False
-                            break
-                    except (ValueError, TypeError):
-                        # Non-numeric comparison - do string comparison
-                        if str(actual_value) != str(min_value):
-                            if mandatory:
-                                reasons.append(
-                                    f"Capability {capability_type} capacity mismatch: "
-                                    f"{capacity_key}={actual_value} != {min_value}"
-                                )
-                            capacity_met = False
-                            break
-
-                if not capacity_met:
-                    continue
+        reasons: list[str] = []
+        capabilities = supplier.get("capabilities", {})
+
+        # Parse each relevant claim once per supplier, not once per check
+        claims = {
+            capability_type: _ClaimView.from_claim(claim, eval_ns)
+            for capability_type, claim in capabilities.items()
+            if capability_type in required_types
+        }
+
+        # Check ALL mandatory requirements (binary AND - all must be true)
+        for requirement in mandatory_requirements:
+            failure = _requirement_failure(
+                claims.get(requirement.capability_type), requirement, eval_ns
+            )
+            if failure is not None:
+                code, fields = failure
+                reasons.append(_FEASIBLE_SET_REASONS[code].format(**fields))
+                if not collect_all_reasons:
+                    break
 
         # Check overall required capacity (tender-level, not per-requirement)
-        if required_capacity:
+        if required_capacity and (collect_all_reasons or not reasons):
             # Check supplier's aggregate capacity across all capabilities
             # This is a simplified check - in practice, capacity aggregation
             # would be more sophisticated (e.g., parallel vs sequential work)
+            capacity_maxima = _capacity_maxima(capabilities)
             for capacity_key, min_value in required_capacity.items():
-                # Find maximum capacity for this metric across all capabilities
-                max_capacity = None
-                for claim in capabilities.values():
-                    if claim.get("capacity") and capacity_key in claim["capacity"]:
-                        capacity_value = claim["capacity"][capacity_key]
-                        try:
-                            capacity_float = float(capacity_value)
-                            if max_capacity is None or capacity_float > max_capacity:
-                                max_capacity = capacity_float
-                        except (ValueError, TypeError):
-                            pass
-
+                max_capacity = capacity_maxima.get(capacity_key)
                 if max_capacity is None:
                     reasons.append(
                         f"Supplier missing required capacity metric: {capacity_key}"
@@ -206,6 +424,8 @@ def compute_feasible_set(
                     reasons.append(
                         f"Insufficient overall capacity: {capacity_key}={max_capacity} < {min_value}"
                     )
+                if reasons and not collect_all_reasons:
+                    break
 
         # Decision: feasible if NO mandatory requirement violations
         if not reasons:
@@ -234,58 +454,14 @@ def check_supplier_meets_requirement(
     Returns:
         Tuple of (meets_requirement, reason_if_not)
     """
-    capability_type = requirement["capability_type"]
-    capabilities = supplier.get("capabilities", {})
+    eval_ns = _wall_ns(evaluation_time)
+    normalized = _NormalizedRequirement.from_requirement(requirement)
+    claim = supplier.get("capabilities", {}).get(normalized.capability_type)
+    view = _ClaimView.from_claim(claim, eval_ns) if claim is not None else None
 
-    if capability_type not in capabilities:
-        return False, f"Missing capability: {capability_type}"
-
-    claim = capabilities[capability_type]
-
-    # Check validity period
-    valid_from = claim.get("valid_from")
-    valid_until = claim.get("valid_until")
-
-    if valid_from and evaluation_time < valid_from:
-        return False, f"Capability not yet valid (valid from {valid_from})"
-
-    if valid_until and evaluation_time > valid_until:
-        return False, f"Capability expired (valid until {valid_until})"
-
-    # Check evidence expiration
-    evidence = claim.get("evidence", [])
-    for ev in evidence:
-        ev_valid_until = ev.get("valid_until")
-        if ev_valid_until and evaluation_time > ev_valid_until:
-            return False, f"Evidence {ev['evidence_id']} expired"
-
-    # Check verification
-    if not claim.get("verified", False):
-        return False, "Evidence not yet verified"
-
-    # Check capacity
-    min_capacity = requirement.get("min_capacity")
-    if min_capacity:
-        claim_capacity = claim.get("capacity")
-        if not claim_capacity:
-            return False, "Missing capacity data"
-
-        for capacity_key, min_value in min_capacity.items():
-            actual_value = claim_capacity.get(capacity_key)
-            if actual_value is None:
-                return False, f"Missing capacity metric: {capacity_key}"
-
-            try:
-                if float(actual_value) < float(min_value):
-                    return (
-                        False,
-                        f"Insufficient capacity: {capacity_key}={actual_value} < {min_value}",
-                    )
-            except (ValueError, TypeError):
-                if str(actual_value) != str(min_value):
-                    return (
-                        False,
-                        f"Capacity mismatch: {capacity_key}={actual_value} != {min_value}",
-                    )
+    failure = _requirement_failure(view, normalized, eval_ns)
+    if failure is None:
+        return True, None
 
-    return True, None
+    code, fields = failure
+    return False, _CHECK_REASONS[code].format(**fields)
@@ -9,6 +9,7 @@ always remain true throughout a computation. Like democracy requiring periodic e
 procurement requires evidence for every capability claim!
 """
 
+from collections.abc import Collection
 from datetime import datetime
 from typing import Any
 
@@ -118,7 +119,7 @@ def validate_evidence_required(evidence: list[Evidence] | None) -> None:
     Raises:
         EvidenceRequiredError: If no evidence provided
     """
-    if evidence is None or len(evidence) == 0:
+    if not evidence:
         raise EvidenceRequiredError(
             "At least one evidence item required - no claim without proof"
         )
@@ -184,7 +185,7 @@ def validate_tender_requirements(requirements: list[dict[str, Any]]) -> None:
     Raises:
         InvalidTenderRequirementError: If requirements invalid
     """
-    if not requirements or len(requirements) == 0:
+    if not requirements:
         raise InvalidTenderRequirementError(
             "At least one requirement required for tender"
         )
@@ -207,7 +208,7 @@ def validate_tender_requirements(requirements: list[dict[str, Any]]) -> None:
 # ============================================================================
 
 
-def validate_feasible_set_not_empty(feasible_suppliers: list[str] | None) -> None:
+def validate_feasible_set_not_empty(feasible_suppliers: Collection[str] | None) -> None:
     """
     Validate feasible set is not empty
 
@@ -215,12 +216,12 @@ def validate_feasible_set_not_empty(feasible_suppliers: list[str] | None) -> Non
     Should trigger law review.
 
     Args:
-        feasible_suppliers: List of feasible supplier IDs
+        feasible_suppliers: Feasible supplier IDs
 
     Raises:
         FeasibleSetEmptyError: If feasible set is empty
     """
-    if feasible_suppliers is None or len(feasible_suppliers) == 0:
+    if not feasible_suppliers:
         raise FeasibleSetEmptyError(
             "No suppliers meet all requirements - feasible set is empty. "
             "Consider reviewing requirements or building supplier capacity."
@@ -255,7 +256,7 @@ def validate_selection_method(
 
 
 def validate_supplier_in_feasible_set(
-    supplier_id: str, feasible_suppliers: list[str]
+    supplier_id: str, feasible_suppliers: Collection[str]
 ) -> None:
     """
     Validate supplier is in feasible set
@@ -264,7 +265,8 @@ def validate_supplier_in_feasible_set(
 
     Args:
         supplier_id: Supplier to validate
-        feasible_suppliers: List of feasible supplier IDs
+        feasible_suppliers: Feasible supplier IDs (pass a set/frozenset built
+            once per tender for O(1) membership on repeated checks)
 
     Raises:
         SupplierNotInFeasibleSetError: If supplier not in set
@@ -319,7 +321,7 @@ def validate_random_seed_verifiable(seed: str | None) -> None:
 
 
 # Critical milestone types that require evidence
-CRITICAL_MILESTONE_TYPES = {"completed", "test_passed", "test_failed"}
+CRITICAL_MILESTONE_TYPES = frozenset({"completed", "test_passed", "test_failed"})
 
 
 def validate_milestone_evidence(milestone_type: str, evidence: list[Any]) -> None:
@@ -336,7 +338,7 @@ def validate_milestone_evidence(milestone_type: str, evidence: list[Any]) -> Non
         MilestoneEvidenceRequiredError: If critical milestone lacks evidence
     """
     if milestone_type in CRITICAL_MILESTONE_TYPES:
-        if not evidence or len(evidence) == 0:
+        if not evidence:
             raise MilestoneEvidenceRequiredError(
                 f"Critical milestone '{milestone_type}' requires evidence"
             )
@@ -352,7 +354,7 @@ def validate_quality_score_range(score: float) -> None:
     Raises:
         InvalidQualityScoreError: If score out of range
     """
-    if score < 0.0 or score > 1.0:
+    if not 0.0 <= score <= 1.0:  # Single chained compare; also rejects NaN
         raise InvalidQualityScoreError(
             f"Quality score must be between 0.0 and 1.0, got {score}"
         )
@@ -368,7 +370,7 @@ def validate_reputation_bounds(reputation: float) -> None:
     Raises:
         InvalidReputationScoreError: If reputation out of range
     """
-    if reputation < 0.0 or reputation > 1.0:
+    if not 0.0 <= reputation <= 1.0:  # Single chained compare; also rejects NaN
         raise InvalidReputationScoreError(
             f"Reputation score must be between 0.0 and 1.0, got {reputation}"
         )
@@ -8,13 +8,27 @@ Fun fact: This architecture mirrors how archaeologists reconstruct ancient civil
 from artifacts (events) - we reconstruct procurement state from immutable event logs!
 """
 
+import sys
+from collections.abc import Callable
 from datetime import datetime
 from decimal import Decimal
-from typing import Any
+from typing import Any, ClassVar
 
 from freedom_that_lasts.kernel.events import Event
+from freedom_that_lasts.resource.feasible import CapabilityIndex, compute_feasible_set
 from freedom_that_lasts.resource.models import TenderStatus
 
+# Supplier events that can change a feasible-set outcome (reputation and
+# awarded value never do)
+_FEASIBILITY_EVENT_TYPES = frozenset(
+    {
+        "SupplierRegistered",
+        "CapabilityClaimAdded",
+        "CapabilityClaimUpdated",
+        "CapabilityClaimRevoked",
+    }
+)
+
 
 class SupplierRegistry:
     """
@@ -27,6 +41,15 @@ class SupplierRegistry:
     def __init__(self):
         """Initialize empty supplier registry"""
         self.suppliers: dict[str, dict[str, Any]] = {}
+        # Running sum of every supplier's total_value_awarded (share denominator)
+        self.total_value_awarded = Decimal("0")
+        # Bumped by every event that can change feasibility; tags the index below
+        self.generation = 0
+        # Inverted index kept in step with claims: capability type -> supplier ids
+        # (dict as an ordered set, in claim order)
+        self._capability_holders: dict[str, dict[str, None]] = {}
+        self._capability_index: CapabilityIndex | None = None
+        self._capability_index_generation = -1
 
     def apply_event(self, event: Event) -> None:
         """
@@ -35,22 +58,21 @@ class SupplierRegistry:
         Args:
             event: Event to apply
         """
-        if event.event_type == "SupplierRegistered":
-            self._apply_supplier_registered(event)
-        elif event.event_type == "CapabilityClaimAdded":
-            self._apply_capability_claim_added(event)
-        elif event.event_type == "CapabilityClaimUpdated":
-            self._apply_capability_claim_updated(event)
-        elif event.event_type == "CapabilityClaimRevoked":
-            self._apply_capability_claim_revoked(event)
-        elif event.event_type == "ReputationUpdated":
-            self._apply_reputation_updated(event)
-        elif event.event_type == "TenderAwarded":
-            self._apply_tender_awarded(event)
+        if event.event_type in _FEASIBILITY_EVENT_TYPES:
+            self.generation += 1
+        handler = self._HANDLERS.get(event.event_type)
+        if handler is not None:
+            handler(self, event)
 
     def _apply_supplier_registered(self, event: Event) -> None:
         """Create supplier entry"""
         payload = event.payload
+        existing = self.suppliers.get(payload["supplier_id"])
+        if existing is not None:
+            # Re-registration starts with no capabilities and no awarded value
+            for capability_type in existing["capabilities"]:
+                self._capability_holders[capability_type].pop(payload["supplier_id"], None)
+            self.total_value_awarded -= existing["total_value_awarded"]
         self.suppliers[payload["supplier_id"]] = {
             "supplier_id": payload["supplier_id"],
             "name": payload["name"],
@@ -72,7 +94,9 @@ class SupplierRegistry:
             # Shouldn't happen, but defensive
             return
 
-        capability_type = payload["capability_type"]
+        # Interned: capability types are few and repeat across every supplier,
+        # and they are the keys the feasibility matcher looks up
+        capability_type = sys.intern(payload["capability_type"])
         self.suppliers[supplier_id]["capabilities"][capability_type] = {
             "claim_id": payload["claim_id"],
             "capability_type": capability_type,
@@ -84,6 +108,7 @@ class SupplierRegistry:
             "verified": True,  # Auto-verified for now (in prod would have verification flow)
             "added_at": payload["added_at"],
         }
+        self._capability_holders.setdefault(capability_type, {})[supplier_id] = None
         self.suppliers[supplier_id]["version"] = event.version
 
     def _apply_capability_claim_updated(self, event: Event) -> None:
@@ -116,6 +141,7 @@ class SupplierRegistry:
 
         if supplier_id in self.suppliers:
             self.suppliers[supplier_id]["capabilities"].pop(capability_type, None)
+            self._capability_holders.get(capability_type, {}).pop(supplier_id, None)
             self.suppliers[supplier_id]["version"] = event.version
 
     def _apply_reputation_updated(self, event: Event) -> None:
@@ -143,23 +169,95 @@ class SupplierRegistry:
             self.suppliers[supplier_id]["total_value_awarded"] = (
                 current_value + contract_value
             )
+            self.total_value_awarded += contract_value
             # Don't update version - TenderAwarded belongs to tender stream, not supplier stream
 
+    # Event type -> handler, resolved with one dict lookup per event
+    _HANDLERS: ClassVar[dict[str, Callable[["SupplierRegistry", Event], None]]] = {
+        "SupplierRegistered": _apply_supplier_registered,
+        "CapabilityClaimAdded": _apply_capability_claim_added,
+        "CapabilityClaimUpdated": _apply_capability_claim_updated,
+        "CapabilityClaimRevoked": _apply_capability_claim_revoked,
+        "ReputationUpdated": _apply_reputation_updated,
+        "TenderAwarded": _apply_tender_awarded,
+    }
+
     def get(self, supplier_id: str) -> dict[str, Any] | None:
         """Get supplier by ID"""
         return self.suppliers.get(supplier_id)
 
+    def get_many(self, supplier_ids: list[str]) -> list[dict[str, Any]]:
+        """Get suppliers by ID in the given order, skipping unknown IDs"""
+        suppliers = self.suppliers
+        return [suppliers[sid] for sid in supplier_ids if sid in suppliers]
+
     def list_all(self) -> list[dict[str, Any]]:
         """List all suppliers"""
         return list(self.suppliers.values())
 
     def list_by_capability(self, capability_type: str) -> list[dict[str, Any]]:
-        """List suppliers with specific capability"""
-        return [
-            s
-            for s in self.suppliers.values()
-            if capability_type in s.get("capabilities", {})
-        ]
+        """
+        List suppliers with specific capability
+
+        Ordered by when each supplier claimed the capability (claim order),
+        not by registration order.
+        """
+        suppliers = self.suppliers
+        return [suppliers[sid] for sid in self._capability_holders.get(capability_type, ())]
+
+    def capability_index(self) -> CapabilityIndex:
+        """
+        Capability index over all registered suppliers
+
+        Snapshot of the incrementally maintained capability -> supplier ids
+        map, rebuilt only when the registry generation changes.
+
+        Returns:
+            CapabilityIndex for compute_feasible_set prefiltering
+        """
+        index = self._capability_index
+        if index is None or self._capability_index_generation != self.generation:
+            index = CapabilityIndex(
+                {
+                    capability_type: frozenset(holders)
+                    for capability_type, holders in self._capability_holders.items()
+                    if holders
+                }
+            )
+            self._capability_index = index
+            self._capability_index_generation = self.generation
+        return index
+
+    def compute_feasible_set(
+        self,
+        requirements: list[dict[str, Any]],
+        required_capacity: dict[str, Any] | None,
+        evaluation_time: datetime,
+        collect_all_reasons: bool = False,
+    ) -> tuple[list[str], list[dict[str, Any]]]:
+        """
+        Feasible set over all registered suppliers
+
+        Feasibility-only evaluation prefilters through the capability index;
+        audit evaluation (collect_all_reasons) checks every supplier in full.
+
+        Args:
+            requirements: List of requirement dictionaries from tender
+            required_capacity: Overall capacity requirements (optional)
+            evaluation_time: Time to check evidence expiration against
+            collect_all_reasons: Record every violation per excluded supplier
+
+        Returns:
+            Tuple of (feasible_supplier_ids[], excluded_with_reasons[])
+        """
+        return compute_feasible_set(
+            suppliers=self.list_all(),
+            requirements=requirements,
+            required_capacity=required_capacity,
+            evaluation_time=evaluation_time,
+            collect_all_reasons=collect_all_reasons,
+            capability_index=None if collect_all_reasons else self.capability_index(),
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Export as dictionary for serialization"""
@@ -180,20 +278,9 @@ class TenderRegistry:
 
     def apply_event(self, event: Event) -> None:
         """Apply event to update projection"""
-        if event.event_type == "TenderCreated":
-            self._apply_tender_created(event)
-        elif event.event_type == "TenderOpened":
-            self._apply_tender_opened(event)
-        elif event.event_type == "FeasibleSetComputed":
-            self._apply_feasible_set_computed(event)
-        elif event.event_type == "SupplierSelected":
-            self._apply_supplier_selected(event)
-        elif event.event_type == "TenderAwarded":
-            self._apply_tender_awarded(event)
-        elif event.event_type == "TenderCompleted":
-            self._apply_tender_completed(event)
-        elif event.event_type == "TenderCancelled":
-            self._apply_tender_cancelled(event)
+        handler = self._HANDLERS.get(event.event_type)
+        if handler is not None:
+            handler(self, event)
 
     def _apply_tender_created(self, event: Event) -> None:
         """Create tender in DRAFT status"""
@@ -299,6 +386,17 @@ class TenderRegistry:
             self.tenders[tender_id]["cancellation_reason"] = payload["reason"]
             self.tenders[tender_id]["version"] = event.version
 
+    # Event type -> handler, resolved with one dict lookup per event
+    _HANDLERS: ClassVar[dict[str, Callable[["TenderRegistry", Event], None]]] = {
+        "TenderCreated": _apply_tender_created,
+        "TenderOpened": _apply_tender_opened,
+        "FeasibleSetComputed": _apply_feasible_set_computed,
+        "SupplierSelected": _apply_supplier_selected,
+        "TenderAwarded": _apply_tender_awarded,
+        "TenderCompleted": _apply_tender_completed,
+        "TenderCancelled": _apply_tender_cancelled,
+    }
+
     def get(self, tender_id: str) -> dict[str, Any] | None:
         """Get tender by ID"""
         return self.tenders.get(tender_id)
@@ -343,12 +441,9 @@ class DeliveryLog:
 
     def apply_event(self, event: Event) -> None:
         """Apply event to update log"""
-        if event.event_type == "MilestoneRecorded":
-            self._apply_milestone_recorded(event)
-        elif event.event_type == "SLABreachDetected":
-            self._apply_sla_breach_detected(event)
-        elif event.event_type == "TenderCompleted":
-            self._apply_tender_completed(event)
+        handler = self._HANDLERS.get(event.event_type)
+        if handler is not None:
+            handler(self, event)
 
     def _apply_milestone_recorded(self, event: Event) -> None:
         """Append milestone"""
@@ -386,6 +481,13 @@ class DeliveryLog:
             "final_quality_score": payload["final_quality_score"],
         })
 
+    # Event type -> handler, resolved with one dict lookup per event
+    _HANDLERS: ClassVar[dict[str, Callable[["DeliveryLog", Event], None]]] = {
+        "MilestoneRecorded": _apply_milestone_recorded,
+        "SLABreachDetected": _apply_sla_breach_detected,
+        "TenderCompleted": _apply_tender_completed,
+    }
+
     def get_by_tender(self, tender_id: str) -> dict[str, Any]:
         """Get all logs for specific tender"""
         return {
@@ -421,12 +523,9 @@ class ProcurementHealthProjection:
 
     def apply_event(self, event: Event) -> None:
         """Apply event to update projection"""
-        if event.event_type == "EmptyFeasibleSetDetected":
-            self._apply_empty_feasible_set_detected(event)
-        elif event.event_type == "SupplierConcentrationWarning":
-            self._apply_concentration_warning(event)
-        elif event.event_type == "SupplierConcentrationHalt":
-            self._apply_concentration_halt(event)
+        handler = self._HANDLERS.get(event.event_type)
+        if handler is not None:
+            handler(self, event)
 
     def _apply_empty_feasible_set_detected(self, event: Event) -> None:
         """Track empty feasible set"""
@@ -465,6 +564,13 @@ class ProcurementHealthProjection:
             "critical_threshold_exceeded": payload["critical_threshold_exceeded"],
         })
 
+    # Event type -> handler, resolved with one dict lookup per event
+    _HANDLERS: ClassVar[dict[str, Callable[["ProcurementHealthProjection", Event], None]]] = {
+        "EmptyFeasibleSetDetected": _apply_empty_feasible_set_detected,
+        "SupplierConcentrationWarning": _apply_concentration_warning,
+        "SupplierConcentrationHalt": _apply_concentration_halt,
+    }
+
     def has_issues(self, tender_id: str | None = None) -> bool:
         """Check if there are any health issues"""
         if tender_id:
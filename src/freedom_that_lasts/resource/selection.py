@@ -13,6 +13,9 @@ import hashlib
 from decimal import Decimal
 from typing import Any
 
+# Shared default for suppliers with no awards yet (Decimal is immutable)
+_DECIMAL_ZERO = Decimal("0")
+
 
 def select_by_rotation(
     feasible_suppliers: list[dict[str, Any]],
@@ -43,14 +46,14 @@ def select_by_rotation(
         >>> selected["supplier_id"]
         's2'  # Lower total_value_awarded
     """
-    if not feasible_suppliers or len(feasible_suppliers) == 0:
+    if not feasible_suppliers:
         raise ValueError("Cannot select from empty feasible set")
 
     # Sort by total_value_awarded (ascending), then supplier_id (for determinism)
     sorted_suppliers = sorted(
         feasible_suppliers,
         key=lambda s: (
-            s.get("total_value_awarded", Decimal("0")),
+            s.get("total_value_awarded", _DECIMAL_ZERO),
             s["supplier_id"],
         ),
     )
@@ -87,7 +90,7 @@ def select_by_random(
         >>> selected["supplier_id"] == selected2["supplier_id"]
         True
     """
-    if not feasible_suppliers or len(feasible_suppliers) == 0:
+    if not feasible_suppliers:
         raise ValueError("Cannot select from empty feasible set")
 
     # Sort by supplier_id for deterministic ordering
@@ -137,12 +140,12 @@ def select_by_rotation_with_random(
         >>> selected["supplier_id"] in ["s1", "s2"]  # Both within 10% of min
         True
     """
-    if not feasible_suppliers or len(feasible_suppliers) == 0:
+    if not feasible_suppliers:
         raise ValueError("Cannot select from empty feasible set")
 
     # Find minimum total_value_awarded
     min_value = min(
-        s.get("total_value_awarded", Decimal("0")) for s in feasible_suppliers
+        s.get("total_value_awarded", _DECIMAL_ZERO) for s in feasible_suppliers
     )
 
     # Calculate threshold (minimum + rotation_threshold%)
@@ -152,7 +155,7 @@ def select_by_rotation_with_random(
     low_loaded = [
         s
         for s in feasible_suppliers
-        if s.get("total_value_awarded", Decimal("0")) <= threshold
+        if s.get("total_value_awarded", _DECIMAL_ZERO) <= threshold
     ]
 
     # If no suppliers in threshold (shouldn't happen), fall back to all
@@ -187,27 +190,48 @@ def compute_supplier_shares(
         >>> shares["s3"]  # 500000 / 1000000 = 0.5
         0.5
     """
-    if not suppliers or len(suppliers) == 0:
-        return {}
+    return compute_supplier_shares_with_total(suppliers)[0]
 
-    # Calculate total procurement value
-    total_value = sum(
-        s.get("total_value_awarded", Decimal("0")) for s in suppliers
-    )
+
+def compute_supplier_shares_with_total(
+    suppliers: list[dict[str, Any]],
+) -> tuple[dict[str, float], Decimal]:
+    """
+    Compute supplier shares and the total procurement value in one traversal
+
+    Reads each registry row once (collecting values while summing), so
+    callers that need both the shares and the total don't walk the
+    registry again.
+
+    Args:
+        suppliers: List of all supplier dictionaries from registry
+
+    Returns:
+        Tuple of (supplier_id → share (0.0-1.0), total value awarded)
+    """
+    if not suppliers:
+        return {}, _DECIMAL_ZERO
+
+    # Collect each supplier's value and the total in a single pass
+    values: list[tuple[str, Decimal]] = []
+    total_value = _DECIMAL_ZERO
+    for supplier in suppliers:
+        supplier_value = supplier.get("total_value_awarded", _DECIMAL_ZERO)
+        values.append((supplier["supplier_id"], supplier_value))
+        total_value += supplier_value
 
     if total_value == 0:
         # No contracts awarded yet - equal shares
-        equal_share = 1.0 / len(suppliers)
-        return {s["supplier_id"]: equal_share for s in suppliers}
+        equal_share = 1.0 / len(values)
+        return {supplier_id: equal_share for supplier_id, _ in values}, total_value
 
     # Calculate each supplier's share
-    shares = {}
-    for supplier in suppliers:
-        supplier_value = supplier.get("total_value_awarded", Decimal("0"))
-        share = float(supplier_value) / float(total_value)
-        shares[supplier["supplier_id"]] = share
-
-    return shares
+    total_float = float(total_value)
+    shares = {
+        supplier_id: float(supplier_value) / total_float
+        for supplier_id, supplier_value in values
+    }
+    return shares, total_value
 
 
 def compute_gini_coefficient(shares: dict[str, float]) -> float:
@@ -233,7 +257,7 @@ def compute_gini_coefficient(shares: dict[str, float]) -> float:
     Corrado Gini in 1912 to measure wealth inequality - we're using it
     to prevent procurement monopolies!
     """
-    if not shares or len(shares) == 0:
+    if not shares:
         return 0.0
 
     if len(shares) == 1:
@@ -314,19 +338,19 @@ def get_rotation_state(suppliers: list[dict[str, Any]]) -> dict[str, Any]:
     if not suppliers:
         return {
             "supplier_loads": {},
-            "min_load": Decimal("0"),
-            "max_load": Decimal("0"),
+            "min_load": _DECIMAL_ZERO,
+            "max_load": _DECIMAL_ZERO,
             "shares": {},
         }
 
     supplier_loads = {
-        s["supplier_id"]: s.get("total_value_awarded", Decimal("0"))
+        s["supplier_id"]: s.get("total_value_awarded", _DECIMAL_ZERO)
         for s in suppliers
     }
 
     loads = list(supplier_loads.values())
-    min_load = min(loads) if loads else Decimal("0")
-    max_load = max(loads) if loads else Decimal("0")
+    min_load = min(loads) if loads else _DECIMAL_ZERO
+    max_load = max(loads) if loads else _DECIMAL_ZERO
 
     shares = compute_supplier_shares(suppliers)
 
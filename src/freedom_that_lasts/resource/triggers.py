@@ -10,7 +10,6 @@ safeguards against procurement capture!
 """
 
 from datetime import datetime
-from decimal import Decimal
 from typing import Any
 
 from freedom_that_lasts.kernel.events import Event, create_event
@@ -20,7 +19,7 @@ from freedom_that_lasts.resource import events
 from freedom_that_lasts.resource.models import TenderStatus
 from freedom_that_lasts.resource.selection import (
     compute_gini_coefficient,
-    compute_supplier_shares,
+    compute_supplier_shares_with_total,
 )
 
 
@@ -65,7 +64,7 @@ def evaluate_empty_feasible_set_trigger(
         feasible_suppliers = tender.get("feasible_suppliers", [])
 
         # Check if feasible set is empty
-        if not feasible_suppliers or len(feasible_suppliers) == 0:
+        if not feasible_suppliers:
             # Emit warning event
             event_payload = events.EmptyFeasibleSetDetected(
                 tender_id=tender_id,
@@ -147,20 +146,15 @@ def evaluate_supplier_concentration_trigger(
     # Extract suppliers from registry
     suppliers = list(supplier_registry.get("suppliers", {}).values())
 
-    if not suppliers or len(suppliers) == 0:
+    if not suppliers:
         return []
 
-    # Compute supplier shares
-    shares = compute_supplier_shares(suppliers)
+    # Compute supplier shares and total procurement value in one pass
+    shares, total_value = compute_supplier_shares_with_total(suppliers)
 
     if not shares:
         return []
 
-    # Compute total procurement value
-    total_value = sum(
-        s.get("total_value_awarded", Decimal("0")) for s in suppliers
-    )
-
     # Compute Gini coefficient
     gini = compute_gini_coefficient(shares)
 
@@ -104,6 +104,25 @@ def test_budget_balance_trigger_multiple_budgets():
     assert events[0].stream_id == "budget-2"
 
 
+def test_budget_balance_trigger_empty_items_serializes_decimal():
+    """Test that a budget with no items reports total_allocated as a Decimal string"""
+    now = datetime(2025, 3, 15, 12, 0, 0)
+
+    active_budgets = [
+        {
+            "budget_id": "budget-1",
+            "budget_total": "150000",
+            "items": {},
+            "version": 1,
+        }
+    ]
+
+    events = evaluate_budget_balance_trigger(active_budgets, now)
+    assert len(events) == 1
+    assert events[0].payload["total_allocated"] == "0"
+    assert events[0].payload["variance"] == "-150000"
+
+
 def test_expenditure_overspend_trigger_no_overspend():
     """Test that no events are emitted when spending is within allocation"""
     now = datetime(2025, 3, 15, 12, 0, 0)
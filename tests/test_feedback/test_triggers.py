@@ -16,6 +16,7 @@ from freedom_that_lasts.feedback.triggers import (
 )
 from freedom_that_lasts.kernel.safety_policy import SafetyPolicy
 from freedom_that_lasts.kernel.time import TestTimeProvider
+from freedom_that_lasts.law.events import LawReviewTriggered
 
 
 def test_delegation_concentration_trigger_no_events() -> None:
@@ -159,6 +160,20 @@ def test_law_review_trigger_overdue_laws() -> None:
         assert event.payload["reason"] == "checkpoint_overdue"
 
 
+def test_law_review_trigger_payload_matches_validated_model() -> None:
+    """Test unvalidated payload construction serializes like the validated model"""
+    now = datetime(2025, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
+    law = {"law_id": "law-1", "status": "ACTIVE", "next_checkpoint_index": 2, "version": 4}
+
+    events = evaluate_law_review_trigger([law], now)
+
+    assert events[0].payload == LawReviewTriggered.model_validate(
+        events[0].payload
+    ).model_dump(mode="json")
+    assert events[0].payload["checkpoint_index"] == 2
+    assert events[0].version == 5
+
+
 def test_law_review_trigger_skips_already_in_review() -> None:
     """Test law review trigger skips laws already in REVIEW status"""
     now = datetime(2025, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
@@ -11,6 +11,7 @@ Fun fact: Event sourcing tests are like archaeology - we're verifying
 that the historical record is complete, immutable, and replayable!
 """
 
+import sys
 from datetime import datetime, timezone
 
 import pytest
@@ -413,3 +414,26 @@ def test_load_stream_returns_empty_for_nonexistent(event_store: SQLiteEventStore
     # This covers the branch where events list is empty (line 289->299)
     events = event_store.load_stream("nonexistent-stream")
     assert events == []
+
+
+def test_loaded_event_types_are_interned(event_store: SQLiteEventStore) -> None:
+    """Test events read back from SQLite share the interned type-name strings"""
+    events = [
+        Event(
+            event_id=generate_id(),
+            stream_id="test-stream-1",
+            stream_type="test",
+            event_type="TestEvent",
+            occurred_at=datetime.now(timezone.utc),
+            command_id=generate_id(),
+            version=version,
+        )
+        for version in (1, 2)
+    ]
+    event_store.append("test-stream-1", 0, events)
+
+    first, second = event_store.load_stream("test-stream-1")
+
+    assert first.event_type is second.event_type
+    assert first.event_type is sys.intern("TestEvent")
+    assert first.stream_type is sys.intern("test")
@@ -16,6 +16,7 @@ import pytest
 from freedom_that_lasts.kernel.errors import (
     DelegationCycleDetected,
     InvalidCheckpointSchedule,
+    InvariantViolation,
     TTLExceedsMaximum,
 )
 from freedom_that_lasts.kernel.safety_policy import SafetyPolicy
@@ -23,7 +24,9 @@ from freedom_that_lasts.law.invariants import (
     compute_graph_depth,
     compute_in_degrees,
     find_cycles,
+    has_any_cycle,
     validate_acyclic_delegation,
+    validate_acyclic_delegation_batch,
     validate_checkpoint_schedule,
     validate_delegation_ttl,
 )
@@ -83,6 +86,14 @@ def test_acyclic_delegation_no_cycle() -> None:
     validate_acyclic_delegation(edges, "alice", "david", now)
 
 
+def test_acyclic_delegation_rejects_self_delegation() -> None:
+    """Test that delegating to oneself is rejected even in an empty graph"""
+    now = datetime.now(timezone.utc)
+
+    with pytest.raises(DelegationCycleDetected):
+        validate_acyclic_delegation([], "alice", "alice", now)
+
+
 def test_acyclic_delegation_detects_simple_cycle() -> None:
     """Test that simple cycles are detected"""
     now = datetime.now(timezone.utc)
@@ -211,6 +222,17 @@ def test_checkpoint_schedule_missing_required() -> None:
         validate_checkpoint_schedule([30, 90, 180], policy)
 
 
+def test_checkpoint_schedule_validation_tracks_policy_changes() -> None:
+    """Test that memoized schedule validation follows policy updates"""
+    policy = SafetyPolicy(law_min_checkpoint_schedule=[30, 90, 180, 365])
+    assert policy.validate_checkpoint_schedule([30, 90, 180, 365]) is True
+    assert policy.validate_checkpoint_schedule([30, 90, 180, 365]) is True
+
+    # Tightening the policy in place must not reuse the cached answer
+    policy.law_min_checkpoint_schedule = [7, 30, 90, 180, 365]
+    assert policy.validate_checkpoint_schedule([30, 90, 180, 365]) is False
+
+
 def test_checkpoint_schedule_empty() -> None:
     """Test that empty checkpoint schedule is rejected"""
     policy = SafetyPolicy()
@@ -219,6 +241,20 @@ def test_checkpoint_schedule_empty() -> None:
         validate_checkpoint_schedule([], policy)
 
 
+def test_checkpoint_schedule_must_be_positive_and_ascending() -> None:
+    """Test that non-positive, unsorted or duplicate checkpoints are rejected"""
+    policy = SafetyPolicy(law_min_checkpoint_schedule=[30, 90, 180, 365])
+
+    with pytest.raises(InvariantViolation, match="positive"):
+        validate_checkpoint_schedule([0, 30, 90, 180, 365], policy)
+
+    with pytest.raises(InvariantViolation, match="ascending"):
+        validate_checkpoint_schedule([30, 180, 90, 365], policy)
+
+    with pytest.raises(InvariantViolation, match="ascending"):
+        validate_checkpoint_schedule([30, 90, 90, 180, 365], policy)
+
+
 def test_compute_in_degrees() -> None:
     """Test in-degree computation for concentration analysis"""
     now = datetime.now(timezone.utc)
@@ -482,3 +518,144 @@ def test_compute_graph_depth_ignores_expired() -> None:
     assert depths["alice"] == 0
     assert depths["bob"] == 1
     assert "charlie" not in depths  # Excluded (expired edge)
+
+
+def test_compute_graph_depth_expired_incoming_edge_does_not_hide_root() -> None:
+    """Test that an actor whose only incoming edge expired is treated as a root"""
+    now = datetime.now(timezone.utc)
+    past = now - timedelta(days=1)
+    future = now + timedelta(days=180)
+
+    # Alice -> Bob (expired but not yet marked inactive), Bob -> Charlie (active)
+    edges = [
+        DelegationEdge(
+            delegation_id="del-1",
+            from_actor="alice",
+            to_actor="bob",
+            workspace_id="ws-1",
+            expires_at=past,
+            is_active=True,
+        ),
+        DelegationEdge(
+            delegation_id="del-2",
+            from_actor="bob",
+            to_actor="charlie",
+            workspace_id="ws-1",
+            expires_at=future,
+            is_active=True,
+        ),
+    ]
+
+    depths = compute_graph_depth(edges, now)
+
+    assert depths == {"bob": 0, "charlie": 1}
+
+
+def test_has_any_cycle_acyclic_graph() -> None:
+    """Test that an acyclic graph (including diamonds) reports no cycle"""
+    now = datetime.now(timezone.utc)
+    future = now + timedelta(days=180)
+
+    # Diamond: A -> B -> D, A -> C -> D (shared descendant, no cycle)
+    edges = [
+        DelegationEdge(
+            delegation_id=f"del-{i}",
+            from_actor=from_actor,
+            to_actor=to_actor,
+            workspace_id="ws-1",
+            expires_at=future,
+            is_active=True,
+        )
+        for i, (from_actor, to_actor) in enumerate(
+            [("alice", "bob"), ("alice", "charlie"), ("bob", "david"), ("charlie", "david")]
+        )
+    ]
+
+    assert has_any_cycle([], now) is False
+    assert has_any_cycle(edges, now) is False
+    assert find_cycles(edges, now) == []
+
+
+def test_has_any_cycle_detects_cycle_and_self_loop() -> None:
+    """Test that cycles and self-loops are detected, inactive edges ignored"""
+    now = datetime.now(timezone.utc)
+    future = now + timedelta(days=180)
+
+    def edge(
+        delegation_id: str, from_actor: str, to_actor: str, active: bool = True
+    ) -> DelegationEdge:
+        return DelegationEdge(
+            delegation_id=delegation_id,
+            from_actor=from_actor,
+            to_actor=to_actor,
+            workspace_id="ws-1",
+            expires_at=future,
+            is_active=active,
+        )
+
+    chain = [edge("del-1", "alice", "bob"), edge("del-2", "bob", "charlie")]
+
+    assert has_any_cycle(chain + [edge("del-3", "charlie", "alice")], now) is True
+    assert has_any_cycle(chain + [edge("del-3", "eve", "eve")], now) is True
+    # Revoked closing edge does not count
+    assert has_any_cycle(chain + [edge("del-3", "charlie", "alice", active=False)], now) is False
+
+
+def test_acyclic_delegation_batch_accepts_valid_batch() -> None:
+    """Test that a batch of non-cyclic delegations passes in one call"""
+    now = datetime.now(timezone.utc)
+    future = now + timedelta(days=180)
+    edges = [
+        DelegationEdge(
+            delegation_id="del-1",
+            from_actor="alice",
+            to_actor="bob",
+            workspace_id="ws-1",
+            expires_at=future,
+            is_active=True,
+        ),
+    ]
+
+    validate_acyclic_delegation_batch(
+        edges, [("bob", "charlie"), ("charlie", "david"), ("alice", "david")], now
+    )
+    validate_acyclic_delegation_batch(edges, [], now)
+
+
+def test_acyclic_delegation_batch_reports_first_offending_edge() -> None:
+    """Test that the batch check blames the same edge sequential checks would"""
+    now = datetime.now(timezone.utc)
+    future = now + timedelta(days=180)
+    edges = [
+        DelegationEdge(
+            delegation_id="del-1",
+            from_actor="alice",
+            to_actor="bob",
+            workspace_id="ws-1",
+            expires_at=future,
+            is_active=True,
+        ),
+    ]
+    batch = [
+        ("bob", "charlie"),
+        ("eve", "frank"),
+        ("charlie", "alice"),  # closes alice -> bob -> charlie -> alice
+        ("frank", "eve"),  # would also close a cycle, but later
+    ]
+
+    with pytest.raises(DelegationCycleDetected) as exc_info:
+        validate_acyclic_delegation_batch(edges, batch, now)
+
+    assert exc_info.value.from_actor == "charlie"
+    assert exc_info.value.to_actor == "alice"
+
+
+def test_acyclic_delegation_batch_rejects_self_loop() -> None:
+    """Test that a self-delegation inside a batch is reported as a cycle"""
+    now = datetime.now(timezone.utc)
+
+    with pytest.raises(DelegationCycleDetected) as exc_info:
+        validate_acyclic_delegation_batch([], [("alice", "bob"), ("eve", "eve")], now)
+
+    assert exc_info.value.from_actor == "eve"
+    assert exc_info.value.to_actor == "eve"
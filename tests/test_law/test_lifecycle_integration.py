@@ -181,6 +181,72 @@ def test_complete_law_lifecycle_happy_path(
     assert law["status"] == "ARCHIVED"
 
 
+def test_consecutive_continue_reviews_advance_checkpoints(
+    handlers: LawCommandHandlers,
+    test_time: TestTimeProvider,
+    workspace_registry: WorkspaceRegistry,
+    law_registry: LawRegistry,
+) -> None:
+    """
+    Test that each "continue" review moves to the following checkpoint
+
+    Regression: the review completion used to drop the checkpoint index,
+    so every later review rescheduled the same (second) checkpoint.
+    """
+    ws_events = handlers.handle_create_workspace(
+        CreateWorkspace(name="Health"), command_id=generate_id(), actor_id="alice"
+    )
+    for event in ws_events:
+        workspace_registry.apply_event(event)
+
+    law_events = handlers.handle_create_law(
+        CreateLaw(
+            workspace_id=ws_events[0].payload["workspace_id"],
+            title="Primary Care Pilot",
+            reversibility_class=ReversibilityClass.SEMI_REVERSIBLE,
+            checkpoints=[30, 90, 180, 365],
+        ),
+        command_id=generate_id(),
+        actor_id="alice",
+        workspace_registry=workspace_registry.to_dict()["workspaces"],
+    )
+    for event in law_events:
+        law_registry.apply_event(event)
+    law_id = law_events[0].payload["law_id"]
+    activated_at = test_time.now()
+
+    for event in handlers.handle_activate_law(
+        ActivateLaw(law_id=law_id),
+        command_id=generate_id(),
+        actor_id="alice",
+        law_registry=law_registry.to_dict()["laws"],
+    ):
+        law_registry.apply_event(event)
+
+    for expected_days, expected_index in [(90, 1), (180, 2)]:
+        for event in handlers.handle_trigger_law_review(
+            TriggerLawReview(law_id=law_id, reason="checkpoint_reached"),
+            command_id=generate_id(),
+            actor_id="system",
+            law_registry=law_registry.to_dict()["laws"],
+        ):
+            law_registry.apply_event(event)
+        for event in handlers.handle_complete_law_review(
+            CompleteLawReview(law_id=law_id, outcome="continue"),
+            command_id=generate_id(),
+            actor_id="alice",
+            law_registry=law_registry.to_dict()["laws"],
+        ):
+            law_registry.apply_event(event)
+
+        law = law_registry.get(law_id)
+        assert law is not None
+        assert law["next_checkpoint_index"] == expected_index
+        assert datetime.fromisoformat(law["next_checkpoint_at"]) == activated_at + timedelta(
+            days=expected_days
+        )
+
+
 def test_law_lifecycle_with_adjustment(
     handlers: LawCommandHandlers,
     test_time: TestTimeProvider,
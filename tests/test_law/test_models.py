@@ -13,10 +13,13 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 
+from freedom_that_lasts.kernel.time import to_epoch_ns
 from freedom_that_lasts.law.models import (
     Delegation,
+    DelegationEdge,
     Law,
     LawStatus,
+    LawSummary,
     ReversibilityClass,
 )
 
@@ -315,6 +318,53 @@ def test_law_days_until_checkpoint_none_when_no_checkpoint(test_time):
     assert law.days_until_checkpoint(test_time.now()) is None
 
 
+def test_law_ns_checkpoint_helpers_match_datetime_versions(test_time):
+    """Test integer-time checkpoint helpers agree with the datetime methods"""
+    now = test_time.now()
+    law = Law(
+        law_id="law-1",
+        workspace_id="ws-1",
+        title="Test Law",
+        reversibility_class=ReversibilityClass.REVERSIBLE,
+        checkpoints=[30, 90, 180],
+        status=LawStatus.ACTIVE,
+        created_at=now,
+        activated_at=now,
+        next_checkpoint_at=now - timedelta(days=10, hours=1),
+    )
+    now_ns = to_epoch_ns(now)
+
+    assert law.is_review_overdue_ns(now_ns) is law.is_review_overdue(now) is True
+    assert law.days_until_checkpoint_ns(now_ns) == law.days_until_checkpoint(now) == -11
+
+    # Reassigning the checkpoint must not reuse the cached nanoseconds
+    law.next_checkpoint_at = now + timedelta(days=25)
+    assert law.is_review_overdue_ns(now_ns) is False
+    assert law.days_until_checkpoint_ns(now_ns) == 25
+
+
+def test_law_summary_build_many(test_time):
+    """Test bulk dashboard summaries compute overdue flags"""
+    now = test_time.now()
+    laws = [
+        Law(
+            law_id=f"law-{offset}",
+            workspace_id="ws-1",
+            title="Test Law",
+            reversibility_class=ReversibilityClass.REVERSIBLE,
+            status=LawStatus.ACTIVE,
+            created_at=now,
+            next_checkpoint_at=None if offset is None else now + timedelta(days=offset),
+        )
+        for offset in (-5, 15, None)
+    ]
+
+    summaries = LawSummary.build_many(laws, now)
+
+    assert [s.law_id for s in summaries] == ["law--5", "law-15", "law-None"]
+    assert [s.is_review_overdue for s in summaries] == [True, False, False]
+
+
 def test_delegation_creation_with_all_fields(test_time):
     """Test creating delegation with all optional fields"""
     delegation = Delegation(
@@ -356,3 +406,26 @@ def test_law_creation_with_metadata(test_time):
     assert law.scope["territory"] == "District5"
     assert law.params["coverage_target"] == 0.95
     assert law.metadata["author"] == "alice"
+
+
+# =============================================================================
+# DelegationEdge Tests
+# =============================================================================
+
+
+def test_delegation_edge_expires_ns_matches_expires_at():
+    """Test integer expiry is exact and ordered like the datetime"""
+    expires_at = datetime(2025, 7, 14, 10, 0, 0, 123456, tzinfo=timezone.utc)
+    edge = DelegationEdge(
+        delegation_id="del-1",
+        from_actor="alice",
+        to_actor="bob",
+        workspace_id="ws-1",
+        expires_at=expires_at,
+        is_active=True,
+    )
+
+    assert edge.expires_ns == int(expires_at.timestamp()) * 1_000_000_000 + 123456000
+    assert to_epoch_ns(expires_at - timedelta(microseconds=1)) < edge.expires_ns
+    # Naive datetimes are treated as UTC
+    assert to_epoch_ns(expires_at.replace(tzinfo=None)) == edge.expires_ns
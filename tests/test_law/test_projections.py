@@ -8,12 +8,14 @@ Fun fact: Projections are like "views" in traditional databases, but better -
 they're rebuil from immutable events, making time travel debugging possible!
 """
 
+import threading
 from datetime import datetime, timedelta, timezone
 
 import pytest
 
 from freedom_that_lasts.kernel.events import Event
 from freedom_that_lasts.kernel.ids import generate_id
+from freedom_that_lasts.law.invariants import compute_in_degrees
 from freedom_that_lasts.law.models import LawStatus
 from freedom_that_lasts.law.projections import (
     WorkspaceRegistry,
@@ -250,7 +252,7 @@ def test_delegation_graph_initial_state():
     """Test graph starts empty"""
     graph = DelegationGraph()
     assert graph.delegations == {}
-    assert graph.edges == []
+    assert graph.edges == {}
 
 
 def test_decision_right_delegated_creates_delegation(test_time):
@@ -293,7 +295,7 @@ def test_decision_right_delegated_creates_delegation(test_time):
 
     # Check edge was created
     assert len(graph.edges) == 1
-    edge = graph.edges[0]
+    edge = graph.edges["del-1"]
     assert edge.delegation_id == "del-1"
     assert edge.from_actor == "alice"
     assert edge.to_actor == "bob"
@@ -350,7 +352,7 @@ def test_delegation_revoked_marks_inactive(test_time):
     assert delegation["revoked_at"] is not None
 
     # Check edge was marked inactive
-    edge = graph.edges[0]
+    edge = graph.edges["del-1"]
     assert edge.is_active is False
 
 
@@ -426,7 +428,7 @@ def test_delegation_expired_marks_inactive(test_time):
     assert delegation["is_active"] is False
 
     # Check edge was marked inactive
-    edge = graph.edges[0]
+    edge = graph.edges["del-1"]
     assert edge.is_active is False
 
 
@@ -661,7 +663,171 @@ def test_delegation_graph_serialization_round_trip(test_time):
 
     assert restored.get("del-1") == graph.get("del-1")
     assert len(restored.edges) == len(graph.edges)
-    assert restored.edges[0].delegation_id == graph.edges[0].delegation_id
+    assert restored.edges.keys() == graph.edges.keys()
+
+
+def delegation_event(
+    delegation_id: str, from_actor: str, to_actor: str, now: datetime, expires_at: datetime
+) -> Event:
+    """Helper to create a DecisionRightDelegated event"""
+    return create_event(
+        event_id=generate_id(),
+        stream_id=delegation_id,
+        stream_type="Delegation",
+        event_type="DecisionRightDelegated",
+        occurred_at=now,
+        command_id=generate_id(),
+        actor_id=from_actor,
+        payload={
+            "delegation_id": delegation_id,
+            "workspace_id": "ws-1",
+            "from_actor": from_actor,
+            "to_actor": to_actor,
+            "delegated_at": now.isoformat(),
+            "ttl_days": 90,
+            "expires_at": expires_at.isoformat(),
+        },
+        version=1,
+    )
+
+
+def test_delegation_graph_maintains_indexes_incrementally(test_time):
+    """Test adjacency/in-degree indexes follow delegations and revocations"""
+    graph = DelegationGraph()
+    now = test_time.now()
+    future = now + timedelta(days=90)
+
+    graph.apply_event(delegation_event("del-1", "alice", "bob", now, future))
+    graph.apply_event(delegation_event("del-2", "carol", "bob", now, future))
+    graph.apply_event(delegation_event("del-3", "bob", "dave", now, future))
+
+    assert graph.in_degrees == {"bob": 2, "dave": 1}
+    assert graph.active_in_degrees(now) == {"bob": 2, "dave": 1}
+    assert graph.would_create_cycle("dave", "alice", now) is True
+    assert graph.would_create_cycle("alice", "dave", now) is False
+
+    graph.apply_event(
+        create_event(
+            event_id=generate_id(),
+            stream_id="del-3",
+            stream_type="Delegation",
+            event_type="DelegationRevoked",
+            occurred_at=now,
+            command_id=generate_id(),
+            actor_id="bob",
+            payload={"delegation_id": "del-3", "revoked_at": now.isoformat()},
+            version=2,
+        )
+    )
+
+    assert graph.in_degrees == {"bob": 2}
+    assert "bob" not in graph.out_edges
+    assert graph.would_create_cycle("dave", "alice", now) is False
+    assert graph.get_delegations_by_actor("bob") == []
+    assert graph.get_delegations_to_actor("dave") == []
+    assert [d["delegation_id"] for d in graph.get_delegations_to_actor("bob")] == [
+        "del-1",
+        "del-2",
+    ]
+
+    # Indexes are rebuilt from serialized state
+    restored = DelegationGraph.from_dict(graph.to_dict())
+    assert restored.in_degrees == graph.in_degrees
+    assert restored.out_edges.keys() == graph.out_edges.keys()
+    assert restored._by_from == graph._by_from
+    assert restored._by_to == graph._by_to
+
+
+def test_active_in_degrees_excludes_time_expired_edges(test_time):
+    """Test active_in_degrees matches compute_in_degrees once edges expire"""
+    graph = DelegationGraph()
+    now = test_time.now()
+
+    graph.apply_event(delegation_event("del-1", "alice", "bob", now, now + timedelta(days=5)))
+    graph.apply_event(delegation_event("del-2", "carol", "bob", now, now + timedelta(days=90)))
+
+    assert graph.active_in_degrees(now) == {"bob": 2}
+
+    later = now + timedelta(days=10)
+    assert graph.active_in_degrees(later) == compute_in_degrees(
+        graph.get_active_edges(later), later
+    )
+    assert graph.active_in_degrees(later) == {"bob": 1}
+    assert graph.active_in_degrees(now + timedelta(days=100)) == {}
+
+
+def test_get_active_edges_reads_index_without_pruning(test_time):
+    """Test get_active_edges keeps delegation order and never drops edges on query"""
+    graph = DelegationGraph()
+    now = test_time.now()
+
+    graph.apply_event(delegation_event("del-1", "carol", "bob", now, now + timedelta(days=90)))
+    graph.apply_event(delegation_event("del-2", "alice", "bob", now, now + timedelta(days=5)))
+
+    later = now + timedelta(days=10)
+    assert [e.delegation_id for e in graph.get_active_edges(later)] == ["del-1"]
+    # Querying a later time must not forget edges still active earlier
+    assert [e.delegation_id for e in graph.get_active_edges(now)] == ["del-1", "del-2"]
+
+
+def test_expiry_columns_match_full_scan_after_revocations(test_time):
+    """Test expiry-sorted columns give the same answers as a full edge scan"""
+    graph = DelegationGraph()
+    now = test_time.now()
+
+    for i, days in enumerate([30, 5, 60, 5, 15]):
+        expires_at = now + timedelta(days=days)
+        graph.apply_event(delegation_event(f"del-{i}", f"actor-{i}", f"hub-{i % 2}", now, expires_at))
+    graph.apply_event(
+        create_event(
+            event_id=generate_id(),
+            stream_id="del-3",
+            stream_type="Delegation",
+            event_type="DelegationRevoked",
+            occurred_at=now,
+            command_id=generate_id(),
+            actor_id="actor-3",
+            payload={"delegation_id": "del-3", "revoked_at": now.isoformat()},
+            version=2,
+        )
+    )
+
+    assert graph._expiry_ns == sorted(graph._expiry_ns)
+    assert sorted(graph._expiry_ids) == sorted(graph._active_edges)
+    # Bulk-indexed restore lays the columns out exactly like incremental inserts
+    restored = DelegationGraph.from_dict(graph.to_dict())
+    assert restored._expiry_ids == graph._expiry_ids
+    assert restored._expiry_ns == graph._expiry_ns
+    assert list(restored._active_edges) == list(graph._active_edges)
+    for days in (0, 5, 10, 20, 45, 90):
+        at = now + timedelta(days=days)
+        full_scan = [e for e in graph.edges.values() if e.is_active and e.expires_at > at]
+        assert graph.get_active_edges(at) == full_scan
+        assert graph.active_in_degrees(at) == compute_in_degrees(full_scan, at)
+
+
+def test_time_dependent_queries_wait_for_writer_lock(test_time):
+    """Test edge/in-degree queries read the indexes under the write lock"""
+    graph = DelegationGraph()
+    now = test_time.now()
+    graph.apply_event(delegation_event("del-1", "alice", "bob", now, now + timedelta(days=5)))
+    later = now + timedelta(days=10)
+
+    queries = [
+        lambda: graph.get_active_edges(later),
+        lambda: graph.active_in_degrees(later),
+        lambda: graph.would_create_cycle("bob", "alice", now),
+        lambda: graph.get_delegations_to_actor("bob"),
+    ]
+    for query in queries:
+        results = []
+        with graph._lock:  # Simulate a writer mid-apply_event
+            reader = threading.Thread(target=lambda: results.append(query()))
+            reader.start()
+            reader.join(timeout=0.05)
+            assert reader.is_alive()  # Blocked until the writer releases
+        reader.join(timeout=5)
+        assert len(results) == 1
 
 
 # =============================================================================
@@ -1195,3 +1361,264 @@ def test_law_registry_serialization_round_trip(test_time):
     restored = LawRegistry.from_dict(data)
 
     assert restored.get("law-1") == registry.get("law-1")
+
+
+def activated_law_events(law_id: str, now: datetime, next_checkpoint_at: datetime) -> list[Event]:
+    """Helper to create LawCreated + LawActivated events for one law"""
+    return [
+        create_event(
+            event_id=generate_id(),
+            stream_id=law_id,
+            stream_type="Law",
+            event_type="LawCreated",
+            occurred_at=now,
+            command_id=generate_id(),
+            actor_id="admin-1",
+            payload={
+                "law_id": law_id,
+                "workspace_id": "ws-1",
+                "title": f"Law {law_id}",
+                "reversibility_class": "REVERSIBLE",
+                "checkpoints": [30],
+                "created_at": now.isoformat(),
+            },
+            version=1,
+        ),
+        create_event(
+            event_id=generate_id(),
+            stream_id=law_id,
+            stream_type="Law",
+            event_type="LawActivated",
+            occurred_at=now,
+            command_id=generate_id(),
+            actor_id="admin-1",
+            payload={
+                "law_id": law_id,
+                "activated_at": now.isoformat(),
+                "next_checkpoint_at": next_checkpoint_at.isoformat(),
+                "next_checkpoint_index": 0,
+            },
+            version=2,
+        ),
+    ]
+
+
+def test_law_list_upcoming_reviews(test_time):
+    """Test list_upcoming_reviews() windows and survives serialization"""
+    registry = LawRegistry()
+    now = test_time.now()
+
+    for law_id, offset_days in (("law-past", -1), ("law-7", 7), ("law-20", 20)):
+        for event in activated_law_events(law_id, now, now + timedelta(days=offset_days)):
+            registry.apply_event(event)
+
+    def ids(laws: list[dict]) -> list[str]:
+        return [law["law_id"] for law in laws]
+
+    assert ids(registry.list_upcoming_reviews(now, 7)) == ["law-7"]
+    assert ids(registry.list_upcoming_reviews(now, 30)) == ["law-7", "law-20"]
+    assert ids(registry.list_overdue_reviews(now)) == ["law-past"]
+
+    restored = LawRegistry.from_dict(registry.to_dict())
+    assert ids(restored.list_upcoming_reviews(now, 30)) == ["law-7", "law-20"]
+    assert ids(restored.list_overdue_reviews(now)) == ["law-past"]
+
+
+def test_law_status_buckets_follow_transitions(test_time):
+    """Test status buckets stay coherent across transitions and serialization"""
+    registry = LawRegistry()
+    now = test_time.now()
+
+    for law_id in ("law-1", "law-2"):
+        for event in activated_law_events(law_id, now, now + timedelta(days=30)):
+            registry.apply_event(event)
+    registry.apply_event(
+        create_event(
+            event_id=generate_id(),
+            stream_id="law-1",
+            stream_type="Law",
+            event_type="LawArchived",
+            occurred_at=now,
+            command_id=generate_id(),
+            actor_id="admin-1",
+            payload={"law_id": "law-1", "archived_at": now.isoformat()},
+            version=3,
+        )
+    )
+
+    assert [law["law_id"] for law in registry.list_active()] == ["law-2"]
+    assert [law["law_id"] for law in registry.list_by_status(LawStatus.ARCHIVED)] == ["law-1"]
+    assert registry.list_by_status(LawStatus.DRAFT) == []
+
+    restored = LawRegistry.from_dict(registry.to_dict())
+    assert restored._by_status == {
+        status: ids for status, ids in registry._by_status.items() if ids
+    }
+
+
+# =============================================================================
+# Replay Watermark Tests
+# =============================================================================
+
+
+def test_replaying_applied_events_is_idempotent(test_time):
+    """Test per-stream version watermark skips already-applied events"""
+    graph = DelegationGraph()
+    now = test_time.now()
+    future = now + timedelta(days=90)
+
+    first = delegation_event("del-1", "alice", "bob", now, future)
+    second = delegation_event("del-2", "carol", "bob", now, future)
+    graph.apply_event(first)
+    graph.apply_event(second)
+
+    # Overlapping catch-up replays del-1 again: must not duplicate the edge
+    graph.apply_event(first)
+
+    assert len(graph.edges) == 2
+    assert graph.in_degrees == {"bob": 2}
+    assert graph.stream_versions == {"del-1": 1, "del-2": 1}
+    assert graph.position_event_id == second.event_id
+
+
+def test_watermark_survives_serialization(test_time):
+    """Test the watermark is persisted so a restored projection resumes correctly"""
+    registry = WorkspaceRegistry()
+    created = create_event(
+        event_id=generate_id(),
+        stream_id="ws-1",
+        stream_type="Workspace",
+        event_type="WorkspaceCreated",
+        occurred_at=test_time.now(),
+        command_id=generate_id(),
+        actor_id="alice",
+        payload={
+            "workspace_id": "ws-1",
+            "name": "Health",
+            "created_at": test_time.now().isoformat(),
+        },
+        version=1,
+    )
+    registry.apply_event(created)
+
+    restored = WorkspaceRegistry.from_dict(registry.to_dict())
+
+    assert restored.stream_versions == {"ws-1": 1}
+    assert restored.position_event_id == created.event_id
+    # Re-delivering the same event after restore is a no-op
+    restored.workspaces["ws-1"]["name"] = "Renamed"
+    restored.apply_event(created)
+    assert restored.workspaces["ws-1"]["name"] == "Renamed"
+
+
+def test_apply_events_matches_single_event_path(test_time):
+    """Test batched apply_events keeps log order and the watermark"""
+    now = test_time.now()
+    events = activated_law_events("law-1", now, now + timedelta(days=30))
+    events += [
+        create_event(
+            event_id=generate_id(),
+            stream_id="law-1",
+            stream_type="Law",
+            event_type=event_type,
+            occurred_at=now,
+            command_id=generate_id(),
+            actor_id="system",
+            payload=payload,
+            version=version,
+        )
+        for version, event_type, payload in (
+            (3, "LawReviewTriggered", {"law_id": "law-1"}),
+            (4, "LawReviewCompleted", {"law_id": "law-1", "outcome": "continue"}),
+            (5, "LawReviewTriggered", {"law_id": "law-1"}),
+        )
+    ]
+
+    single = LawRegistry()
+    for event in events:
+        single.apply_event(event)
+    batched = LawRegistry()
+    batched.apply_events(events + events[:2])  # trailing duplicates are skipped
+
+    assert batched.to_dict() == single.to_dict()
+    assert batched.get("law-1")["status"] == "REVIEW"
+    assert batched.position_event_id == events[-1].event_id
+
+
+def test_list_snapshots_are_reused_until_next_write(test_time):
+    """Test list queries serve a cached snapshot until the generation moves on"""
+    registry = LawRegistry()
+    now = test_time.now()
+    for event in activated_law_events("law-1", now, now + timedelta(days=30)):
+        registry.apply_event(event)
+
+    first = registry.list_active()
+    assert registry._laws_with_status("ACTIVE") is registry._laws_with_status("ACTIVE")
+    first.clear()  # callers get their own list copy
+    assert [law["law_id"] for law in registry.list_active()] == ["law-1"]
+
+    assert registry.generation == 2
+    law_2_events = activated_law_events("law-2", now, now + timedelta(days=30))
+    registry.apply_events(law_2_events + law_2_events)  # duplicates are not applied
+
+    assert registry.generation == 4
+    assert [law["law_id"] for law in registry.list_active()] == ["law-1", "law-2"]
+
+
+def test_handled_event_types_match_handler_tables():
+    """Test HANDLED_EVENT_TYPES is derived from each projection's handlers"""
+    assert WorkspaceRegistry.HANDLED_EVENT_TYPES == {"WorkspaceCreated", "WorkspaceArchived"}
+    assert DelegationGraph.HANDLED_EVENT_TYPES == {
+        "DecisionRightDelegated",
+        "DelegationRevoked",
+        "DelegationExpired",
+    }
+    assert "LawReviewCompleted" in LawRegistry.HANDLED_EVENT_TYPES
+    assert LawRegistry.HANDLED_EVENT_TYPES.isdisjoint(DelegationGraph.HANDLED_EVENT_TYPES)
+
+
+def test_to_bytes_round_trip(test_time):
+    """Test compact byte snapshots restore the same state"""
+    now = test_time.now()
+    graph = DelegationGraph.rebuild_from(
+        None,
+        [
+            delegation_event("del-1", "álmos", "bob", now, now + timedelta(days=30)),
+            delegation_event("del-2", "carol", "bob", now, now + timedelta(days=60)),
+        ],
+    )
+
+    data = graph.to_bytes()
+
+    assert b"\xc3\xa1lmos" in data  # raw UTF-8, not \u escapes
+    restored = DelegationGraph.from_bytes(data)
+    assert restored.to_dict() == graph.to_dict()
+    assert restored.in_degrees == {"bob": 2}
+
+
+def test_rebuild_from_snapshot_plus_tail(test_time, projection_store):
+    """Test snapshot + delta replay matches a full cold rebuild"""
+    now = test_time.now()
+    future = now + timedelta(days=90)
+    log = [
+        delegation_event(f"del-{i}", f"actor-{i}", "hub", now, future) for i in range(5)
+    ]
+
+    # Snapshot after the first three events, persisted in the projection store
+    partial = DelegationGraph.rebuild_from(None, log[:3])
+    projection_store.save(
+        "delegation_graph", partial.to_dict(), position_event_id=partial.position_event_id
+    )
+
+    from_tail = DelegationGraph.rebuild_from(
+        projection_store.load_state("delegation_graph"), log[3:]
+    )
+    # An overlapping replay of the whole log is also safe
+    from_overlap = DelegationGraph.rebuild_from(
+        projection_store.load_state("delegation_graph"), log
+    )
+    cold = DelegationGraph.rebuild_from(None, log)
+
+    for graph in (from_tail, from_overlap):
+        assert graph.to_dict() == cold.to_dict()
+        assert graph.in_degrees == {"hub": 5}
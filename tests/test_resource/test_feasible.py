@@ -15,6 +15,7 @@ from decimal import Decimal
 import pytest
 
 from freedom_that_lasts.resource.feasible import (
+    CapabilityIndex,
     compute_feasible_set,
     check_supplier_meets_requirement,
 )
@@ -1274,3 +1275,206 @@ def test_supplier_with_no_capabilities_dict() -> None:
 
     assert_feasible_set(feasible, [])
     assert_exclusion_reasons(excluded, "s1", ["Missing required capability", "ISO27001"])
+
+
+def test_first_violation_short_circuits_unless_collecting_all_reasons() -> None:
+    """Test default mode stops at the first violation; audit mode records every one"""
+    eval_time = datetime(2025, 1, 15, tzinfo=timezone.utc)
+
+    supplier = {"supplier_id": "s1", "capabilities": {}}
+    requirements = [
+        create_requirement("r1", "ISO27001"),
+        create_requirement("r2", "GDPR_Compliant"),
+    ]
+
+    feasible, excluded = compute_feasible_set(
+        suppliers=[supplier],
+        requirements=requirements,
+        required_capacity={"staff_count": 10},
+        evaluation_time=eval_time,
+    )
+
+    assert_feasible_set(feasible, [])
+    assert excluded[0]["reasons"] == ["Missing required capability: ISO27001"]
+
+    feasible, excluded = compute_feasible_set(
+        suppliers=[supplier],
+        requirements=requirements,
+        required_capacity={"staff_count": 10},
+        evaluation_time=eval_time,
+        collect_all_reasons=True,
+    )
+
+    assert_feasible_set(feasible, [])
+    assert excluded[0]["reasons"] == [
+        "Missing required capability: ISO27001",
+        "Missing required capability: GDPR_Compliant",
+        "Supplier missing required capacity metric: staff_count",
+    ]
+
+
+def test_capability_index_prefilters_suppliers_missing_mandatory_capability() -> None:
+    """Test inverted index excludes suppliers lacking a capability without evaluating claims"""
+    eval_time = datetime(2025, 1, 15, tzinfo=timezone.utc)
+
+    valid_from = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    s1 = create_supplier_with_capabilities(
+        "s1",
+        {
+            "ISO27001": create_capability("ISO27001", valid_from),
+            "GDPR_Compliant": create_capability("GDPR_Compliant", valid_from),
+        },
+    )
+    s2 = create_supplier_with_capabilities(
+        "s2", {"ISO27001": create_capability("ISO27001", valid_from)}
+    )
+    # s3 lacks ISO27001 and its GDPR claim is malformed; prefiltering never parses it
+    s3 = {"supplier_id": "s3", "capabilities": {"GDPR_Compliant": {"valid_from": "not-a-date"}}}
+    suppliers = [s1, s2, s3]
+
+    index = CapabilityIndex.from_suppliers(suppliers)
+    assert index.suppliers_with("ISO27001") == frozenset({"s1", "s2"})
+    assert index.suppliers_with("SOC2") == frozenset()
+
+    requirements = [
+        create_requirement("r1", "ISO27001"),
+        create_requirement("r2", "GDPR_Compliant"),
+    ]
+
+    feasible, excluded = compute_feasible_set(
+        suppliers=suppliers,
+        requirements=requirements,
+        required_capacity=None,
+        evaluation_time=eval_time,
+        capability_index=index,
+    )
+
+    assert_feasible_set(feasible, ["s1"], excluded=["s2", "s3"])
+    assert excluded == [
+        {"supplier_id": "s2", "reasons": ["Missing required capability: GDPR_Compliant"]},
+        {"supplier_id": "s3", "reasons": ["Missing required capability: ISO27001"]},
+    ]
+
+
+def test_capability_index_reports_first_failure_in_requirement_order() -> None:
+    """Test the prefilter reports the same first reason as the unindexed path"""
+    eval_time = datetime(2025, 1, 15, tzinfo=timezone.utc)
+
+    # First requirement's claim has expired, second capability is missing
+    supplier = create_supplier_with_capabilities(
+        "s1",
+        {
+            "ISO27001": create_capability(
+                "ISO27001",
+                datetime(2024, 1, 1, tzinfo=timezone.utc),
+                valid_until=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            )
+        },
+    )
+    requirements = [
+        create_requirement("r1", "ISO27001"),
+        create_requirement("r2", "GDPR_Compliant"),
+    ]
+
+    _, prefiltered = compute_feasible_set(
+        suppliers=[supplier],
+        requirements=requirements,
+        required_capacity=None,
+        evaluation_time=eval_time,
+        capability_index=CapabilityIndex.from_suppliers([supplier]),
+    )
+    _, all_reasons = compute_feasible_set(
+        suppliers=[supplier],
+        requirements=requirements,
+        required_capacity=None,
+        evaluation_time=eval_time,
+        collect_all_reasons=True,
+    )
+
+    assert prefiltered[0]["reasons"] == all_reasons[0]["reasons"][:1]
+    assert_exclusion_reasons(prefiltered, "s1", ["Capability ISO27001 expired"])
+
+
+def test_stale_capability_index_does_not_change_result() -> None:
+    """Test a supplier the index misses is still evaluated, not dropped"""
+    eval_time = datetime(2025, 1, 15, tzinfo=timezone.utc)
+    valid_from = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    s1 = create_supplier_with_capabilities(
+        "s1", {"ISO27001": create_capability("ISO27001", valid_from)}
+    )
+    s2 = create_supplier_with_capabilities(
+        "s2", {"ISO27001": create_capability("ISO27001", valid_from)}
+    )
+    # Built before s2 claimed ISO27001
+    stale_index = CapabilityIndex.from_suppliers([s1])
+    requirements = [create_requirement("r1", "ISO27001")]
+
+    expected = compute_feasible_set(
+        suppliers=[s1, s2],
+        requirements=requirements,
+        required_capacity=None,
+        evaluation_time=eval_time,
+    )
+    result = compute_feasible_set(
+        suppliers=[s1, s2],
+        requirements=requirements,
+        required_capacity=None,
+        evaluation_time=eval_time,
+        capability_index=stale_index,
+    )
+
+    assert result == expected
+    assert_feasible_set(result[0], ["s1", "s2"])
+
+
+def test_overall_required_capacity_with_no_requirements() -> None:
+    """Test tender-level capacity is checked even when the tender lists no requirements"""
+    eval_time = datetime(2025, 1, 15, tzinfo=timezone.utc)
+    valid_from = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    s1 = create_supplier_with_capabilities(
+        "s1",
+        {"ISO27001": create_capability("ISO27001", valid_from, capacity={"staff_count": 80})},
+    )
+    s2 = create_supplier_with_capabilities(
+        "s2",
+        {"ISO27001": create_capability("ISO27001", valid_from, capacity={"staff_count": 20})},
+    )
+
+    feasible, excluded = compute_feasible_set(
+        suppliers=[s1, s2],
+        requirements=[],
+        required_capacity={"staff_count": 50},
+        evaluation_time=eval_time,
+    )
+
+    assert_feasible_set(feasible, ["s1"], excluded=["s2"])
+    assert_exclusion_reasons(excluded, "s2", ["Insufficient overall capacity", "staff_count=20.0 < 50"])
+
+
+def test_check_supplier_meets_requirement_agrees_with_feasible_set_on_string_dates() -> None:
+    """Test single-pair check shares the feasible-set logic, incl. ISO string parsing"""
+    eval_time = datetime(2025, 1, 15, tzinfo=timezone.utc)
+
+    supplier = {
+        "supplier_id": "s1",
+        "capabilities": {
+            "ISO27001": {
+                "capability_type": "ISO27001",
+                "valid_from": "2025-02-01T00:00:00+00:00",  # String, not yet valid
+                "valid_until": None,
+                "evidence": [],
+                "verified": True,
+            }
+        },
+    }
+    requirement = create_requirement("r1", "ISO27001")
+
+    meets, reason = check_supplier_meets_requirement(supplier, requirement, eval_time)
+    feasible, excluded = compute_feasible_set([supplier], [requirement], None, eval_time)
+
+    assert meets is False
+    assert reason == "Capability not yet valid (valid from 2025-02-01 00:00:00+00:00)"
+    assert_feasible_set(feasible, [])
+    assert_exclusion_reasons(excluded, "s1", ["not yet valid", "valid from 2025-02-01"])
@@ -16,7 +16,7 @@ from decimal import Decimal
 
 import pytest
 
-from freedom_that_lasts.kernel.events import create_event
+from freedom_that_lasts.kernel.events import Event, create_event
 from freedom_that_lasts.kernel.ids import generate_id
 from freedom_that_lasts.resource.commands import (
     AddCapabilityClaim,
@@ -30,7 +30,17 @@ from freedom_that_lasts.resource.commands import (
     RegisterSupplier,
     SelectSupplier,
 )
+from freedom_that_lasts.resource.events import (
+    FeasibleSetComputed,
+    ReputationUpdated,
+    SupplierSelectionFailed,
+    TenderCompleted,
+)
 from freedom_that_lasts.resource.handlers import ResourceCommandHandlers
+from freedom_that_lasts.resource.invariants import (
+    InvalidQualityScoreError,
+    InvalidReputationScoreError,
+)
 from freedom_that_lasts.resource.models import SelectionMethod, TenderStatus
 from freedom_that_lasts.resource.projections import SupplierRegistry, TenderRegistry
 
@@ -100,6 +110,60 @@ def create_tender_in_evaluating_status(
     tender_registry.apply_event(feasible_event)
 
 
+def create_supplier_registry_with_award(
+    test_time,
+    supplier_ids: list[str] | None = None,
+    awarded_supplier_id: str = "s1",
+    contract_value: str = "100000",
+) -> SupplierRegistry:
+    """
+    Helper to create a supplier registry where one contract has been awarded.
+
+    Applies: SupplierRegistered per supplier → TenderAwarded (so the share and
+    reputation gates are active)
+    """
+    if supplier_ids is None:
+        supplier_ids = [awarded_supplier_id]
+
+    supplier_registry = SupplierRegistry()
+    for supplier_id in supplier_ids:
+        supplier_registry.apply_event(
+            create_event(
+                event_id=generate_id(),
+                stream_id=supplier_id,
+                stream_type="Supplier",
+                event_type="SupplierRegistered",
+                occurred_at=test_time.now(),
+                command_id=generate_id(),
+                actor_id="admin-1",
+                payload={
+                    "supplier_id": supplier_id,
+                    "name": supplier_id,
+                    "supplier_type": "general",
+                    "registered_at": test_time.now().isoformat(),
+                    "registered_by": "admin-1",
+                    "metadata": {},
+                },
+                version=1,
+            )
+        )
+
+    supplier_registry.apply_event(
+        create_event(
+            event_id=generate_id(),
+            stream_id="t0",
+            stream_type="Tender",
+            event_type="TenderAwarded",
+            occurred_at=test_time.now(),
+            command_id=generate_id(),
+            actor_id="admin-1",
+            payload={"awarded_supplier_id": awarded_supplier_id, "contract_value": contract_value},
+            version=1,
+        )
+    )
+    return supplier_registry
+
+
 def create_tender_in_awarded_status(
     tender_registry: TenderRegistry,
     test_time,
@@ -249,6 +313,8 @@ def test_register_supplier_success(resource_handlers, test_time) -> None:
     assert "supplier_id" in event.payload
     assert event.command_id == "cmd-1"
     assert event.actor_id == "admin-1"
+    # Envelope is built without validation; it must still be a valid Event
+    assert Event.model_validate(event.model_dump()) == event
 
 
 def test_register_supplier_minimal_fields(resource_handlers, test_time) -> None:
@@ -933,6 +999,11 @@ def test_create_tender_success(resource_handlers, test_time, mock_law_registry)
     assert len(event.payload["requirements"]) == 2
     assert event.payload["selection_method"] == SelectionMethod.ROTATION_WITH_RANDOM.value
     assert "tender_id" in event.payload
+    # Tender, event and requirement IDs are drawn together but stay distinct
+    ids = [event.event_id, event.payload["tender_id"]] + [
+        req["requirement_id"] for req in event.payload["requirements"]
+    ]
+    assert len(set(ids)) == 4
     # Status is set by projection, not in event payload
 
 
@@ -1462,6 +1533,11 @@ def test_evaluate_tender_success_with_feasible_suppliers(
     assert "s1" in event.payload["feasible_suppliers"]
     assert len(event.payload["excluded_suppliers_with_reasons"]) == 0
     assert "evaluation_time" in event.payload
+    # Payload is built without validation; it must still round-trip through the model
+    assert (
+        FeasibleSetComputed.model_validate(event.payload).model_dump(mode="json")
+        == event.payload
+    )
 
 
 def test_evaluate_tender_empty_feasible_set(resource_handlers, test_time) -> None:
@@ -2598,6 +2674,80 @@ def test_select_supplier_gate3_supplier_share_limit_first_procurement(
     assert events[0].payload["selected_supplier_id"] == "s1"
 
 
+def test_select_supplier_gate3_excludes_supplier_over_share_limit(
+    resource_handlers, test_time
+) -> None:
+    """Test GATE 3: once contracts exist, suppliers above the share limit are excluded"""
+    tender_registry = TenderRegistry()
+    # s1 holds 100% of awarded value (> 35% halt threshold)
+    supplier_registry = create_supplier_registry_with_award(test_time, supplier_ids=["s1", "s2"])
+
+    # Only the over-limit supplier is feasible
+    create_tender_in_evaluating_status(tender_registry, test_time, feasible_suppliers=["s1"])
+
+    events = resource_handlers.handle_select_supplier(
+        command=SelectSupplier(tender_id="t1", selection_seed=None),
+        command_id="cmd-1",
+        actor_id="admin-1",
+        tender_registry=tender_registry,
+        supplier_registry=supplier_registry,
+    )
+
+    assert len(events) == 1
+    assert events[0].event_type == "SupplierSelectionFailed"
+    assert "share concentration limit" in events[0].payload["failure_reason"]
+    # Payload has the exact shape the event model would dump
+    payload = events[0].payload
+    assert SupplierSelectionFailed.model_validate(payload).model_dump(mode="json") == payload
+
+
+def test_select_supplier_reads_live_safety_policy(resource_handlers, test_time) -> None:
+    """Test that in-place policy updates apply to the next selection"""
+    tender_registry = TenderRegistry()
+    supplier_registry = create_supplier_registry_with_award(test_time)
+    create_tender_in_evaluating_status(tender_registry, test_time, feasible_suppliers=["s1"])
+
+    # Lift both gates in place on the policy object the handlers hold
+    resource_handlers.safety_policy.supplier_share_halt_threshold = 1.0
+    resource_handlers.safety_policy.supplier_min_reputation_threshold = None
+
+    events = resource_handlers.handle_select_supplier(
+        command=SelectSupplier(tender_id="t1", selection_seed=None),
+        command_id="cmd-1",
+        actor_id="admin-1",
+        tender_registry=tender_registry,
+        supplier_registry=supplier_registry,
+    )
+
+    assert events[0].event_type == "SupplierSelected"
+    assert events[0].payload["selected_supplier_id"] == "s1"
+
+
+def test_select_supplier_gate4_reputation_threshold_after_awards(
+    resource_handlers, test_time
+) -> None:
+    """Test GATE 4: once contracts exist, suppliers below the reputation threshold fail"""
+    tender_registry = TenderRegistry()
+    # New supplier starts at reputation 0.5 (< threshold 0.6)
+    supplier_registry = create_supplier_registry_with_award(test_time)
+    create_tender_in_evaluating_status(tender_registry, test_time, feasible_suppliers=["s1"])
+
+    # Let s1 through GATE 3 and enable GATE 4 (this module's policy disables it)
+    resource_handlers.safety_policy.supplier_share_halt_threshold = 1.0
+    resource_handlers.safety_policy.supplier_min_reputation_threshold = 0.6
+
+    events = resource_handlers.handle_select_supplier(
+        command=SelectSupplier(tender_id="t1", selection_seed=None),
+        command_id="cmd-1",
+        actor_id="admin-1",
+        tender_registry=tender_registry,
+        supplier_registry=supplier_registry,
+    )
+
+    assert events[0].event_type == "SupplierSelectionFailed"
+    assert "reputation threshold 0.6" in events[0].payload["failure_reason"]
+
+
 def test_select_supplier_gate4_reputation_threshold_first_procurement(
     resource_handlers, test_time
 ) -> None:
@@ -3330,6 +3480,13 @@ def test_complete_tender_success_with_reputation_update(resource_handlers, test_
     assert reputation_event.payload["new_score"] == pytest.approx(0.58)
     assert "t1" in reputation_event.payload["reason"]
 
+    # Payloads have the exact shape the event models would dump
+    for event, model in (
+        (completed_event, TenderCompleted),
+        (reputation_event, ReputationUpdated),
+    ):
+        assert model.model_validate(event.payload).model_dump(mode="json") == event.payload
+
 
 def test_complete_tender_reputation_formula(resource_handlers, test_time) -> None:
     """Test reputation update formula: 0.8 * old + 0.2 * quality"""
@@ -3452,6 +3609,58 @@ def test_complete_tender_quality_score_validation(resource_handlers, test_time)
 
 
 
+def test_complete_tender_rejects_out_of_range_scores(resource_handlers, test_time) -> None:
+    """Test the handler's range checks raise the invariant errors"""
+    tender_registry = TenderRegistry()
+    supplier_registry = SupplierRegistry()
+    supplier_registry.apply_event(
+        create_event(
+            event_id=generate_id(),
+            stream_id="s1",
+            stream_type="Supplier",
+            event_type="SupplierRegistered",
+            occurred_at=test_time.now(),
+            command_id=generate_id(),
+            actor_id="admin-1",
+            payload={
+                "supplier_id": "s1",
+                "name": "Test",
+                "supplier_type": "general",
+                "registered_at": test_time.now().isoformat(),
+                "registered_by": "admin-1",
+                "metadata": {},
+            },
+            version=1,
+        )
+    )
+    create_tender_in_awarded_status(tender_registry, test_time, tender_id="t1", selected_supplier_id="s1")
+
+    # Quality score outside [0, 1] (bypassing command validation)
+    command = CompleteTender.model_construct(
+        tender_id="t1", completion_report={}, final_quality_score=1.5
+    )
+    with pytest.raises(InvalidQualityScoreError, match="got 1.5"):
+        resource_handlers.handle_complete_tender(
+            command=command,
+            command_id="cmd-1",
+            actor_id="admin-1",
+            tender_registry=tender_registry,
+            supplier_registry=supplier_registry,
+        )
+
+    # Corrupted stored reputation pushes the update out of bounds
+    supplier_registry.suppliers["s1"]["reputation_score"] = 3.0
+    command = CompleteTender(tender_id="t1", completion_report={}, final_quality_score=1.0)
+    with pytest.raises(InvalidReputationScoreError):
+        resource_handlers.handle_complete_tender(
+            command=command,
+            command_id="cmd-1",
+            actor_id="admin-1",
+            tender_registry=tender_registry,
+            supplier_registry=supplier_registry,
+        )
+
+
 def test_complete_tender_no_selected_supplier(resource_handlers, test_time) -> None:
     """Test completion fails if tender has no selected supplier"""
     tender_registry = TenderRegistry()
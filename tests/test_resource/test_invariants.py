@@ -354,6 +354,13 @@ class TestValidateSupplierInFeasibleSet:
         with pytest.raises(SupplierNotInFeasibleSetError):
             validate_supplier_in_feasible_set("supplier-1", [])
 
+    def test_frozenset_feasible_set(self):
+        """Precomputed frozenset works the same as a list"""
+        feasible_set = frozenset(["supplier-1", "supplier-2"])
+        validate_supplier_in_feasible_set("supplier-2", feasible_set)
+        with pytest.raises(SupplierNotInFeasibleSetError):
+            validate_supplier_in_feasible_set("supplier-999", feasible_set)
+
 
 class TestValidateSupplierShareLimit:
     """Test supplier share limit validation"""
@@ -512,6 +519,11 @@ class TestValidateQualityScoreRange:
         with pytest.raises(InvalidQualityScoreError):
             validate_quality_score_range(5.0)
 
+    def test_nan_score_raises_error(self):
+        """NaN quality score is not in range"""
+        with pytest.raises(InvalidQualityScoreError):
+            validate_quality_score_range(float("nan"))
+
 
 class TestValidateReputationBounds:
     """Test reputation score bounds validation"""
@@ -542,3 +554,8 @@ class TestValidateReputationBounds:
         """Reputation above 1.0 should raise error"""
         with pytest.raises(InvalidReputationScoreError):
             validate_reputation_bounds(1.5)
+
+    def test_nan_reputation_raises_error(self):
+        """NaN reputation is not in range"""
+        with pytest.raises(InvalidReputationScoreError):
+            validate_reputation_bounds(float("nan"))
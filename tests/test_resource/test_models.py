@@ -216,6 +216,32 @@ def test_capability_claim_capability_type_empty_raises():
     assert "Capability type cannot be empty" in str(exc_info.value)
 
 
+def test_capability_and_evidence_types_are_interned():
+    """Test equal type strings from separate inputs resolve to one shared object"""
+    # Built at runtime so each is a distinct str object before validation
+    first = "".join(["ISO", "27001 "])
+    second = "".join(["ISO", "27001"])
+    assert first.strip() is not second
+
+    requirement_a = TenderRequirement(requirement_id="r1", capability_type=first)
+    requirement_b = TenderRequirement(requirement_id="r2", capability_type=second)
+    assert requirement_a.capability_type is requirement_b.capability_type
+
+    evidence_a = Evidence(
+        evidence_id="ev-1",
+        evidence_type="".join(["cert", "ification"]),
+        issuer="ISO",
+        issued_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+    evidence_b = Evidence(
+        evidence_id="ev-2",
+        evidence_type="".join(["certific", "ation"]),
+        issuer="ISO",
+        issued_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+    assert evidence_a.evidence_type is evidence_b.evidence_type
+
+
 def test_capability_claim_empty_evidence_raises():
     """Test CapabilityClaim rejects empty evidence list"""
     with pytest.raises(ValidationError) as exc_info:
@@ -429,6 +429,59 @@ def test_tender_awarded_accumulates_contract_value(test_time):
     registry.apply_event(award_event2)
 
     assert registry.get("s1")["total_value_awarded"] == Decimal("150000")
+    assert registry.total_value_awarded == Decimal("150000")
+
+
+def test_reregistration_removes_supplier_value_from_running_total(test_time):
+    """Test re-registering a supplier drops its awards from the registry total"""
+    registry = SupplierRegistry()
+    register_payload = {
+        "supplier_id": "s1",
+        "name": "Acme",
+        "supplier_type": "general",
+        "registered_at": test_time.now().isoformat(),
+        "registered_by": "admin-1",
+        "metadata": {},
+    }
+    for version in (1, 2):
+        registry.apply_event(
+            create_event(
+                event_id=generate_id(),
+                stream_id="s1",
+                stream_type="Supplier",
+                event_type="SupplierRegistered",
+                occurred_at=test_time.now(),
+                command_id=generate_id(),
+                actor_id="admin-1",
+                payload=register_payload,
+                version=version,
+            )
+        )
+        if version == 1:
+            registry.apply_event(
+                create_event(
+                    event_id=generate_id(),
+                    stream_id="t1",
+                    stream_type="Tender",
+                    event_type="TenderAwarded",
+                    occurred_at=test_time.now(),
+                    command_id=generate_id(),
+                    actor_id="admin-1",
+                    payload={
+                        "tender_id": "t1",
+                        "awarded_supplier_id": "s1",
+                        "contract_value": "100",
+                        "contract_terms": {},
+                        "awarded_at": test_time.now().isoformat(),
+                        "awarded_by": "admin-1",
+                    },
+                    version=1,
+                )
+            )
+            assert registry.total_value_awarded == Decimal("100")
+
+    assert registry.get("s1")["total_value_awarded"] == Decimal("0")
+    assert registry.total_value_awarded == Decimal("0")
 
 
 def test_list_by_capability_filters_suppliers(test_time):
@@ -494,6 +547,183 @@ def test_supplier_registry_get_returns_none_for_missing():
     assert registry.get("nonexistent") is None
 
 
+def test_supplier_registry_get_many_preserves_order_and_skips_missing(test_time):
+    """Test get_many() returns known suppliers in request order, dropping unknown IDs"""
+    registry = SupplierRegistry()
+    for version, supplier_id in enumerate(["s1", "s2"], start=1):
+        registry.apply_event(
+            create_event(
+                event_id=generate_id(),
+                stream_id=supplier_id,
+                stream_type="Supplier",
+                event_type="SupplierRegistered",
+                occurred_at=test_time.now(),
+                command_id=generate_id(),
+                actor_id="admin-1",
+                payload={
+                    "supplier_id": supplier_id,
+                    "name": supplier_id,
+                    "supplier_type": "general",
+                    "registered_at": test_time.now().isoformat(),
+                },
+                version=version,
+            )
+        )
+
+    suppliers = registry.get_many(["s2", "missing", "s1"])
+
+    assert [s["supplier_id"] for s in suppliers] == ["s2", "s1"]
+    assert registry.get_many([]) == []
+
+
+def supplier_event(event_type: str, payload: dict, version: int, now: datetime) -> Event:
+    """Helper to create a Supplier stream event"""
+    return create_event(
+        event_id=generate_id(),
+        stream_id=payload["supplier_id"],
+        stream_type="Supplier",
+        event_type=event_type,
+        occurred_at=now,
+        command_id=generate_id(),
+        actor_id="admin-1",
+        payload=payload,
+        version=version,
+    )
+
+
+def test_supplier_registry_generation_tracks_feasibility_events(test_time):
+    """Test only supplier/capability events bump the generation and change feasibility"""
+    registry = SupplierRegistry()
+    eval_time = datetime(2025, 6, 1, tzinfo=timezone.utc)
+    requirements = [{"requirement_id": "r1", "capability_type": "ISO27001", "mandatory": True}]
+
+    registry.apply_event(
+        supplier_event(
+            "SupplierRegistered",
+            {
+                "supplier_id": "s1",
+                "name": "Acme Corp",
+                "supplier_type": "general",
+                "registered_at": test_time.now().isoformat(),
+            },
+            1,
+            test_time.now(),
+        )
+    )
+
+    feasible, excluded = registry.compute_feasible_set(requirements, None, eval_time)
+    assert feasible == []
+    assert excluded == [
+        {"supplier_id": "s1", "reasons": ["Missing required capability: ISO27001"]}
+    ]
+
+    generation = registry.generation
+
+    # Reputation never affects feasibility: generation unchanged
+    registry.apply_event(
+        supplier_event(
+            "ReputationUpdated", {"supplier_id": "s1", "new_score": 0.9}, 2, test_time.now()
+        )
+    )
+    assert registry.generation == generation
+
+    # A new capability claim bumps the generation
+    registry.apply_event(
+        supplier_event(
+            "CapabilityClaimAdded",
+            {
+                "supplier_id": "s1",
+                "claim_id": "claim-1",
+                "capability_type": "ISO27001",
+                "scope": "Information Security Management",
+                "valid_from": datetime(2025, 1, 1, tzinfo=timezone.utc),
+                "valid_until": datetime(2026, 1, 1, tzinfo=timezone.utc),
+                "evidence": [],
+                "capacity": None,
+                "added_at": test_time.now().isoformat(),
+            },
+            3,
+            test_time.now(),
+        )
+    )
+    assert registry.generation == generation + 1
+    assert registry.compute_feasible_set(requirements, None, eval_time) == (["s1"], [])
+
+
+def test_supplier_registry_capability_index_tracks_claims(test_time):
+    """Test the capability index follows claim additions, revocations and re-registration"""
+    registry = SupplierRegistry()
+
+    def register(supplier_id: str) -> None:
+        registry.apply_event(
+            supplier_event(
+                "SupplierRegistered",
+                {
+                    "supplier_id": supplier_id,
+                    "name": supplier_id,
+                    "supplier_type": "general",
+                    "registered_at": test_time.now().isoformat(),
+                },
+                1,
+                test_time.now(),
+            )
+        )
+
+    def claim(supplier_id: str, capability_type: str) -> None:
+        registry.apply_event(
+            supplier_event(
+                "CapabilityClaimAdded",
+                {
+                    "supplier_id": supplier_id,
+                    "claim_id": f"{supplier_id}-{capability_type}",
+                    "capability_type": capability_type,
+                    "scope": {},
+                    "valid_from": "2025-01-01T00:00:00+00:00",
+                    "evidence": [],
+                    "added_at": test_time.now().isoformat(),
+                },
+                2,
+                test_time.now(),
+            )
+        )
+
+    for supplier_id in ("s1", "s2"):
+        register(supplier_id)
+        claim(supplier_id, "ISO27001")
+    claim("s1", "SOC2")
+
+    index = registry.capability_index()
+    assert index.suppliers_with("ISO27001") == {"s1", "s2"}
+    assert index.suppliers_with("SOC2") == {"s1"}
+    # Snapshot is reused until the registry changes
+    assert registry.capability_index() is index
+
+    registry.apply_event(
+        supplier_event(
+            "CapabilityClaimRevoked",
+            {"supplier_id": "s2", "capability_type": "ISO27001"},
+            3,
+            test_time.now(),
+        )
+    )
+    assert registry.capability_index().suppliers_with("ISO27001") == {"s1"}
+    assert [s["supplier_id"] for s in registry.list_by_capability("ISO27001")] == ["s1"]
+
+    # Re-registering drops the supplier's previous claims from the index
+    register("s1")
+    assert registry.capability_index().suppliers_with("SOC2") == frozenset()
+    assert registry.list_by_capability("ISO27001") == []
+
+    # Feasibility-only evaluation excludes via the index
+    feasible, excluded = registry.compute_feasible_set(
+        [{"requirement_id": "r1", "capability_type": "ISO27001", "mandatory": True}],
+        None,
+        datetime(2025, 6, 1, tzinfo=timezone.utc),
+    )
+    assert feasible == []
+    assert {entry["supplier_id"] for entry in excluded} == {"s1", "s2"}
+
+
 def test_supplier_registry_defensive_against_missing_supplier(test_time):
     """Test event handlers are defensive when supplier doesn't exist"""
     registry = SupplierRegistry()
@@ -1111,6 +1341,26 @@ def test_tender_registry_get_returns_none_for_missing():
     assert registry.get("nonexistent") is None
 
 
+def test_tender_registry_ignores_unhandled_event_types(test_time):
+    """Test events without a registered handler leave the projection untouched"""
+    registry = TenderRegistry()
+    event = create_event(
+        event_id=generate_id(),
+        stream_id="supplier-1",
+        stream_type="Supplier",
+        event_type="SupplierRegistered",
+        occurred_at=test_time.now(),
+        command_id=generate_id(),
+        actor_id="admin",
+        payload={"supplier_id": "supplier-1", "name": "Acme"},
+        version=1,
+    )
+
+    registry.apply_event(event)
+
+    assert registry.tenders == {}
+
+
 # =============================================================================
 # DeliveryLog Tests
 # =============================================================================
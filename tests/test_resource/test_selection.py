@@ -18,6 +18,7 @@ from freedom_that_lasts.resource.selection import (
     select_by_random,
     select_by_rotation_with_random,
     compute_supplier_shares,
+    compute_supplier_shares_with_total,
     compute_gini_coefficient,
     apply_reputation_threshold,
     get_rotation_state,
@@ -324,6 +325,22 @@ def test_compute_supplier_shares_zero_total() -> None:
     assert shares["s3"] == pytest.approx(1.0 / 3)
 
 
+def test_compute_supplier_shares_with_total() -> None:
+    """Test shares and total come from one traversal and match the separate computations"""
+    suppliers = [
+        {"supplier_id": "s1", "total_value_awarded": Decimal("300000")},
+        {"supplier_id": "s2"},  # Missing value counts as zero
+        {"supplier_id": "s3", "total_value_awarded": Decimal("700000")},
+    ]
+
+    shares, total_value = compute_supplier_shares_with_total(suppliers)
+
+    assert total_value == Decimal("1000000")
+    assert shares == compute_supplier_shares(suppliers)
+    assert shares["s2"] == 0.0
+    assert compute_supplier_shares_with_total([]) == ({}, Decimal("0"))
+
+
 def test_compute_supplier_shares_empty_list() -> None:
     """Test supplier shares with empty supplier list"""
     shares = compute_supplier_shares([])